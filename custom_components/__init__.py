@@ -0,0 +1 @@
+"""Dummy init so that pytest can import the custom components."""
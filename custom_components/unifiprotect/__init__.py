@@ -3,50 +3,67 @@ from __future__ import annotations
 
 import asyncio
 from datetime import timedelta
+import functools
 import logging
 
-from aiohttp import CookieJar
 from aiohttp.client_exceptions import ServerDisconnectedError
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    CONF_HOST,
-    CONF_PASSWORD,
-    CONF_PORT,
-    CONF_USERNAME,
-    CONF_VERIFY_SSL,
-    EVENT_HOMEASSISTANT_STOP,
-    Platform,
-)
+from homeassistant.const import CONF_VERIFY_SSL, EVENT_HOMEASSISTANT_STOP, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from pyunifiprotect import NotAuthorized, NvrError, ProtectApiClient
 from pyunifiprotect.data import ModelType
 
+from . import (
+    binary_sensor,
+    button,
+    camera,
+    light,
+    media_player,
+    number,
+    select,
+    sensor,
+    switch,
+)
 from .const import (
     CONF_ALL_UPDATES,
     CONF_DOORBELL_TEXT,
-    CONF_OVERRIDE_CHOST,
     CONFIG_OPTIONS,
     DEFAULT_SCAN_INTERVAL,
-    DEVICES_FOR_SUBSCRIBE,
     DEVICES_THAT_ADOPT,
     DOMAIN,
     MIN_REQUIRED_PROTECT_V,
     OUTDATED_LOG_MESSAGE,
-    PLATFORMS,
 )
-from .data import ProtectData
-from .services import async_cleanup_services, async_setup_services
+from .data import REFRESH_TIMEOUT, EntityFactory, ProtectData
+from .services import (
+    async_cleanup_services,
+    async_get_device_index,
+    async_setup_services,
+)
+from .session import async_get_session_manager
+from .views import async_setup_views
 
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+# builds the entities of each platform for one device
+ENTITY_FACTORIES: dict[Platform, EntityFactory] = {
+    Platform.BINARY_SENSOR: binary_sensor.async_device_entities,
+    Platform.BUTTON: button.async_device_entities,
+    Platform.CAMERA: camera.async_device_entities,
+    Platform.LIGHT: light.async_device_entities,
+    Platform.MEDIA_PLAYER: media_player.async_device_entities,
+    Platform.NUMBER: number.async_device_entities,
+    Platform.SELECT: select.async_device_entities,
+    Platform.SENSOR: sensor.async_device_entities,
+    Platform.SWITCH: switch.async_device_entities,
+}
 
 
 @callback
-async def _async_migrate_data(
+def _async_migrate_data(
     hass: HomeAssistant, entry: ConfigEntry, protect: ProtectApiClient
 ) -> None:
     # already up to date, skip
@@ -63,11 +80,11 @@ async def _async_migrate_data(
         del options[CONF_DOORBELL_TEXT]
     hass.config_entries.async_update_entry(entry, data=data, options=options)
 
-    # migrate entities
+    # migrate entities, reusing the bootstrap fetched by ProtectData
     registry = er.async_get(hass)
     mac_to_id: dict[str, str] = {}
     mac_to_channel_id: dict[str, str] = {}
-    bootstrap = await protect.get_bootstrap()
+    bootstrap = protect.bootstrap
     for model in DEVICES_THAT_ADOPT:
         attr = model.value + "s"
         for device in getattr(bootstrap, attr).values():
@@ -81,16 +98,14 @@ async def _async_migrate_data(
                     break
             mac_to_channel_id[device.mac] = channel_id
 
-    count = 0
+    # work out every new unique ID first, then rewrite the registry in one pass
+    migrations: list[tuple[er.RegistryEntry, str]] = []
     entities = er.async_entries_for_config_entry(registry, entry.entry_id)
     for entity in entities:
         new_unique_id: str | None = None
         if entity.domain != Platform.CAMERA.value:
-            parts = entity.unique_id.split("_")
-            if len(parts) >= 2:
-                device_or_key = "_".join(parts[:-1])
-                mac = parts[-1]
-
+            device_or_key, sep, mac = entity.unique_id.rpartition("_")
+            if sep:
                 device_id = mac_to_id[mac]
                 if device_or_key == device_id:
                     new_unique_id = device_id
@@ -109,9 +124,11 @@ async def _async_migrate_data(
                 extra = "" if len(parts) == 3 else "_insecure"
                 new_unique_id = f"{device_id}_{channel_id}{extra}"
 
-        if new_unique_id is None:
-            continue
+        if new_unique_id is not None:
+            migrations.append((entity, new_unique_id))
 
+    count = 0
+    for entity, new_unique_id in migrations:
         _LOGGER.debug(
             "Migrating entity %s (old unique_id: %s, new unique_id: %s)",
             entity.entity_id,
@@ -152,27 +169,16 @@ def _async_import_options_from_data_if_missing(
         hass.config_entries.async_update_entry(entry, data=data, options=options)
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up the UniFi Protect config entries."""
-    _async_import_options_from_data_if_missing(hass, entry)
-
-    session = async_create_clientsession(hass, cookie_jar=CookieJar(unsafe=True))
-    protect = ProtectApiClient(
-        host=entry.data[CONF_HOST],
-        port=entry.data[CONF_PORT],
-        username=entry.data[CONF_USERNAME],
-        password=entry.data[CONF_PASSWORD],
-        verify_ssl=entry.data[CONF_VERIFY_SSL],
-        session=session,
-        subscribed_models=DEVICES_FOR_SUBSCRIBE,
-        override_connection_host=entry.options.get(CONF_OVERRIDE_CHOST, False),
-        ignore_stats=not entry.options.get(CONF_ALL_UPDATES, False),
-    )
-    _LOGGER.debug("Connect to UniFi Protect")
-    data_service = ProtectData(hass, protect, SCAN_INTERVAL, entry)
-
+async def _async_connect(
+    hass: HomeAssistant, entry: ConfigEntry, data_service: ProtectData
+) -> bool:
+    """Check the NVR and fetch the initial bootstrap."""
+    profiler = data_service.profiler
     try:
-        nvr_info = await protect.get_nvr()
+        with profiler.phase("get_nvr"):
+            nvr_info = await asyncio.wait_for(
+                data_service.api.get_nvr(), REFRESH_TIMEOUT
+            )
     except NotAuthorized as err:
         raise ConfigEntryAuthFailed(err) from err
     except (asyncio.TimeoutError, NvrError, ServerDisconnectedError) as err:
@@ -186,17 +192,55 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
         return False
 
-    await _async_migrate_data(hass, entry, protect)
     if entry.unique_id is None:
         hass.config_entries.async_update_entry(entry, unique_id=nvr_info.mac)
 
-    await data_service.async_setup()
+    with profiler.phase("bootstrap"):
+        await data_service.async_setup()
     if not data_service.last_update_success:
         raise ConfigEntryNotReady
+    return True
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up the UniFi Protect config entries."""
+    _async_import_options_from_data_if_missing(hass, entry)
+
+    # reuses the session of the config flow that validated the login
+    sessions = async_get_session_manager(hass)
+    session = sessions.async_acquire(entry.data, entry.options)
+    protect = session.api
+    _LOGGER.debug("Connect to UniFi Protect")
+    data_service = ProtectData(hass, protect, SCAN_INTERVAL, entry, session)
+
+    try:
+        connected = await _async_connect(hass, entry, data_service)
+    except Exception:
+        await data_service.async_stop()
+        sessions.async_release(session)
+        raise
+    if not connected:
+        await data_service.async_stop()
+        sessions.async_release(session)
+        return False
+    entry.async_on_unload(functools.partial(sessions.async_release, session))
+
+    profiler = data_service.profiler
+    with profiler.phase("migrate"):
+        _async_migrate_data(hass, entry, protect)
+
+    with profiler.phase("build_entities"):
+        # platforms without entities are set up once a matching device is adopted
+        data_service.platforms = data_service.async_get_platforms()
+        data_service.async_build_entities(ENTITY_FACTORIES)
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = data_service
-    hass.config_entries.async_setup_platforms(entry, PLATFORMS)
-    async_setup_services(hass)
+    with profiler.phase("forward_platforms"):
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = data_service
+        async_get_device_index(hass).async_add_entry(entry.entry_id, data_service)
+        profiler.async_expect_platforms(data_service.platforms)
+        hass.config_entries.async_setup_platforms(entry, data_service.platforms)
+        async_setup_services(hass)
+        async_setup_views(hass)
 
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
     entry.async_on_unload(
@@ -208,15 +252,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update options."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    data: ProtectData = hass.data[DOMAIN][entry.entry_id]
+    if not data.async_apply_options():
+        await hass.config_entries.async_reload(entry.entry_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload UniFi Protect config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        data: ProtectData = hass.data[DOMAIN][entry.entry_id]
+    data: ProtectData = hass.data[DOMAIN][entry.entry_id]
+    if unload_ok := await hass.config_entries.async_unload_platforms(
+        entry, data.platforms
+    ):
         await data.async_stop()
         hass.data[DOMAIN].pop(entry.entry_id)
+        async_get_device_index(hass).async_remove_entry(entry.entry_id)
         async_cleanup_services(hass)
 
     return bool(unload_ok)
@@ -3,7 +3,10 @@ from __future__ import annotations
 
 from copy import copy
 from dataclasses import dataclass
+from datetime import timedelta
 import logging
+import time
+from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -11,13 +14,15 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_LAST_TRIP_TIME, ATTR_MODEL
+from homeassistant.const import ATTR_LAST_TRIP_TIME, ATTR_MODEL, Platform
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pyunifiprotect.data import NVR, Camera, Event, Light, MountType, Sensor
+from pyunifiprotect.data.base import ProtectAdoptableDeviceModel, ProtectDeviceModel
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_RING
 from .data import ProtectData
 from .entity import (
     EventThumbnailMixin,
@@ -26,10 +31,12 @@ from .entity import (
     async_all_device_entities,
 )
 from .models import ProtectRequiredKeysMixin
+from .profiler import profile_platform
 from .utils import get_nested_attr
 
 _LOGGER = logging.getLogger(__name__)
 _KEY_DOOR = "door"
+_KEY_DOORBELL = "doorbell"
 
 
 @dataclass
@@ -39,6 +46,10 @@ class ProtectBinaryEntityDescription(
     """Describes UniFi Protect Binary Sensor entity."""
 
     ufp_last_trip_value: str | None = None
+    # minimum time to stay on once triggered
+    ufp_on_hold: timedelta | None = None
+    # time to wait before following the device back to off
+    ufp_off_delay: timedelta | None = None
 
 
 MOUNT_DEVICE_CLASS_MAP = {
@@ -50,7 +61,7 @@ MOUNT_DEVICE_CLASS_MAP = {
 
 CAMERA_SENSORS: tuple[ProtectBinaryEntityDescription, ...] = (
     ProtectBinaryEntityDescription(
-        key="doorbell",
+        key=_KEY_DOORBELL,
         name="Doorbell",
         device_class=BinarySensorDeviceClass.OCCUPANCY,
         icon="mdi:doorbell-video",
@@ -79,6 +90,8 @@ LIGHT_SENSORS: tuple[ProtectBinaryEntityDescription, ...] = (
         device_class=BinarySensorDeviceClass.MOTION,
         ufp_value="is_pir_motion_detected",
         ufp_last_trip_value="last_motion",
+        # PIR sensors can flap several times a second in windy conditions
+        ufp_off_delay=timedelta(seconds=2),
     ),
 )
 
@@ -105,6 +118,8 @@ SENSE_SENSORS: tuple[ProtectBinaryEntityDescription, ...] = (
         ufp_value="is_motion_detected",
         ufp_last_trip_value="motion_detected_at",
         ufp_enabled="is_motion_sensor_enabled",
+        # same PIR flapping as the lights
+        ufp_off_delay=timedelta(seconds=2),
     ),
     ProtectBinaryEntityDescription(
         key="tampering",
@@ -122,6 +137,8 @@ MOTION_SENSORS: tuple[ProtectBinaryEntityDescription, ...] = (
         device_class=BinarySensorDeviceClass.MOTION,
         ufp_value="is_motion_detected",
         ufp_last_trip_value="last_motion",
+        # short motion events are reported as on and off within a second
+        ufp_on_hold=timedelta(seconds=5),
     ),
 )
 
@@ -136,6 +153,7 @@ DISK_SENSORS: tuple[ProtectBinaryEntityDescription, ...] = (
 )
 
 
+@profile_platform(Platform.BINARY_SENSOR)
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -143,26 +161,52 @@ async def async_setup_entry(
 ) -> None:
     """Set up binary sensors for UniFi Protect integration."""
     data: ProtectData = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def _add_new_device(device: ProtectAdoptableDeviceModel) -> None:
+        async_add_entities(async_device_entities(data, device))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, data.adopt_signal, _add_new_device)
+    )
+
+    async_add_entities(
+        data.async_pop_entities(Platform.BINARY_SENSOR, async_device_entities)
+    )
+
+
+@callback
+def async_device_entities(
+    data: ProtectData, device: ProtectDeviceModel
+) -> list[ProtectDeviceEntity]:
+    """Build the binary sensors of the NVR or a device."""
+    if isinstance(device, NVR):
+        return _async_nvr_entities(data)
+
     entities: list[ProtectDeviceEntity] = async_all_device_entities(
         data,
         ProtectDeviceBinarySensor,
         camera_descs=CAMERA_SENSORS,
         light_descs=LIGHT_SENSORS,
         sense_descs=SENSE_SENSORS,
+        platform=Platform.BINARY_SENSOR,
+        ufp_device=device,
     )
-    entities += _async_motion_entities(data)
-    entities += _async_nvr_entities(data)
-
-    async_add_entities(entities)
+    entities += _async_motion_entities(data, device)
+    return entities
 
 
 @callback
 def _async_motion_entities(
-    data: ProtectData,
+    data: ProtectData, device: ProtectDeviceModel
 ) -> list[ProtectDeviceEntity]:
     entities: list[ProtectDeviceEntity] = []
-    for device in data.api.bootstrap.cameras.values():
+    if isinstance(device, Camera):
         for description in MOTION_SENSORS:
+            if data.async_is_entity_disabled(
+                Platform.BINARY_SENSOR, f"{device.id}_{description.key}"
+            ):
+                continue
             entities.append(ProtectEventBinarySensor(data, device, description))
             _LOGGER.debug(
                 "Adding binary sensor entity %s for %s",
@@ -181,6 +225,10 @@ def _async_nvr_entities(
     device = data.api.bootstrap.nvr
     for index, _ in enumerate(device.system_info.storage.devices):
         for description in DISK_SENSORS:
+            if data.async_is_entity_disabled(
+                Platform.BINARY_SENSOR, f"{device.id}_{description.key}_{index}"
+            ):
+                continue
             entities.append(
                 ProtectDiskBinarySensor(data, device, description, index=index)
             )
@@ -198,18 +246,82 @@ class ProtectDeviceBinarySensor(ProtectDeviceEntity, BinarySensorEntity):
     device: Camera | Light | Sensor
     entity_description: ProtectBinaryEntityDescription
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the Binary Sensor."""
+        self._on_since = 0.0
+        super().__init__(*args, **kwargs)
+
+    @callback
+    def _async_debounce(self, is_on: bool) -> bool:
+        """Apply the on hold and off delay of the description."""
+        now = time.monotonic()
+        if is_on:
+            self.data.timers.cancel(self)
+            if not self._attr_is_on:
+                self._on_since = now
+            return True
+
+        if not self._attr_is_on:
+            return False
+        if self.data.timers.is_scheduled(self):
+            return True
+
+        release_at = now
+        if self.entity_description.ufp_off_delay is not None:
+            release_at += self.entity_description.ufp_off_delay.total_seconds()
+        if self.entity_description.ufp_on_hold is not None:
+            release_at = max(
+                release_at,
+                self._on_since + self.entity_description.ufp_on_hold.total_seconds(),
+            )
+        if release_at <= now:
+            return False
+
+        self.data.timers.schedule(self, release_at - now, self._async_release)
+        return True
+
+    @callback
+    def _async_release(self) -> None:
+        """Turn off after the on hold or off delay expires."""
+        self._attr_is_on = False
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        # rings are signaled directly to the doorbell sensor
+        if self.entity_description.key == _KEY_DOORBELL:
+            self.async_on_remove(
+                self.data.async_subscribe_device_id(
+                    f"{self.device.id}_{SIGNAL_RING}", self._async_updated_event
+                )
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """When entity will be removed from hass."""
+        await super().async_will_remove_from_hass()
+        self.data.timers.cancel(self)
+
     @callback
     def _async_update_device_from_protect(self) -> None:
         super()._async_update_device_from_protect()
 
-        if self.entity_description.key == "doorbell":
+        if self.entity_description.key == _KEY_DOORBELL:
             new_value = self.entity_description.get_ufp_value(self.device)
             if new_value != self.is_on:
                 _LOGGER.debug(
                     "Changing doorbell sensor from %s to %s", self.is_on, new_value
                 )
 
-        self._attr_is_on = self.entity_description.get_ufp_value(self.device)
+        is_on = self.entity_description.get_ufp_value(self.device)
+        if (
+            self.entity_description.ufp_on_hold is not None
+            or self.entity_description.ufp_off_delay is not None
+        ):
+            is_on = self._async_debounce(bool(is_on))
+        self._attr_is_on = is_on
+        # last trip time always follows the device, even while on is held
         if self.entity_description.ufp_last_trip_value is not None:
             last_trip = get_nested_attr(
                 self.device, self.entity_description.ufp_last_trip_value
@@ -269,7 +381,18 @@ class ProtectEventBinarySensor(EventThumbnailMixin, ProtectDeviceBinarySensor):
         """Get event from Protect device."""
 
         event: Event | None = None
-        if self.device.is_motion_detected and self.device.last_motion_event is not None:
+        # keep the event while the sensor is held on after motion has ended
+        if self._attr_is_on and self.device.last_motion_event is not None:
             event = self.device.last_motion_event
 
         return event
+
+    @callback
+    def _async_release(self) -> None:
+        self._event = None
+        attrs = self.extra_state_attributes or {}
+        self._attr_extra_state_attributes = {
+            **attrs,
+            **self._async_thumbnail_extra_attrs(),
+        }
+        super()._async_release()
@@ -5,17 +5,21 @@ import logging
 
 from homeassistant.components.button import ButtonDeviceClass, ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from pyunifiprotect.data.base import ProtectAdoptableDeviceModel
+from pyunifiprotect.data.base import ProtectAdoptableDeviceModel, ProtectDeviceModel
 
-from .const import DEVICES_THAT_ADOPT, DOMAIN
+from .const import DOMAIN
 from .data import ProtectData
 from .entity import ProtectDeviceEntity
+from .profiler import profile_platform
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@profile_platform(Platform.BUTTON)
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -24,16 +28,28 @@ async def async_setup_entry(
     """Discover devices on a UniFi Protect NVR."""
     data: ProtectData = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(
-        [
-            ProtectButton(
-                data,
-                device,
-            )
-            for device in data.get_by_types(DEVICES_THAT_ADOPT)
-        ]
+    @callback
+    def _add_new_device(device: ProtectAdoptableDeviceModel) -> None:
+        async_add_entities(async_device_entities(data, device))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, data.adopt_signal, _add_new_device)
     )
 
+    async_add_entities(data.async_pop_entities(Platform.BUTTON, async_device_entities))
+
+
+@callback
+def async_device_entities(
+    data: ProtectData, device: ProtectDeviceModel
+) -> list[ProtectDeviceEntity]:
+    """Build the reboot button of a device."""
+    if not isinstance(device, ProtectAdoptableDeviceModel):
+        return []
+    if data.async_is_entity_disabled(Platform.BUTTON, device.id):
+        return []
+    return [ProtectButton(data, device)]
+
 
 class ProtectButton(ProtectDeviceEntity, ButtonEntity):
     """A Ubiquiti UniFi Protect Reboot button."""
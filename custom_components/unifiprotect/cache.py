@@ -0,0 +1,183 @@
+"""On-disk cache for UniFi Protect Integration."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_STORAGE_VERSION = 1
+CACHE_SAVE_DELAY = 60
+DEFAULT_CACHE_MAX_SIZE = 100 * 1024 * 1024
+
+
+class ProtectFileCache:
+    """Size capped on-disk LRU cache of immutable blobs.
+
+    Blobs are stored content-addressed under their SHA-256 digest, so the same
+    image cached under several keys is only written once. The key to digest
+    index is kept in memory in LRU order and persisted with a ``Store``.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: str,
+        max_size: int = DEFAULT_CACHE_MAX_SIZE,
+    ) -> None:
+        """Init the cache."""
+        self._hass = hass
+        self._path = Path(path)
+        self._max_size = max_size
+        self._store = Store(hass, CACHE_STORAGE_VERSION, f"{DOMAIN}_cache")
+        self._index: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._refs: dict[str, int] = {}
+        self._size = 0
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self._pending: dict[str, asyncio.Future[bytes | None]] = {}
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached blobs in bytes."""
+        return self._size
+
+    def _file(self, digest: str) -> Path:
+        return self._path / digest[:2] / digest
+
+    def _read(self, digest: str) -> bytes | None:
+        try:
+            return self._file(digest).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, digest: str, data: bytes) -> None:
+        path = self._file(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def _delete(self, digests: list[str]) -> None:
+        for digest in digests:
+            self._file(digest).unlink(missing_ok=True)
+
+    async def _async_load(self) -> None:
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            stored = await self._store.async_load() or {}
+            for key, digest, size in stored.get("entries", []):
+                self._add(key, digest, size)
+            self._loaded = True
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "entries": [
+                [key, digest, size] for key, (digest, size) in self._index.items()
+            ]
+        }
+
+    @callback
+    def _add(self, key: str, digest: str, size: int) -> bool:
+        """Index a blob, return if the blob is not on disk yet."""
+        self._index[key] = (digest, size)
+        refs = self._refs.get(digest, 0)
+        self._refs[digest] = refs + 1
+        if refs == 0:
+            self._size += size
+        return refs == 0
+
+    @callback
+    def _remove(self, key: str) -> str | None:
+        """Unindex a blob, return its digest if it is no longer referenced."""
+        digest, size = self._index.pop(key)
+        self._refs[digest] -= 1
+        if self._refs[digest] > 0:
+            return None
+
+        del self._refs[digest]
+        self._size -= size
+        return digest
+
+    async def async_get(self, key: str) -> bytes | None:
+        """Get a cached blob and mark it as recently used."""
+        await self._async_load()
+        if (entry := self._index.get(key)) is None:
+            return None
+
+        data = await self._hass.async_add_executor_job(self._read, entry[0])
+        if key not in self._index:
+            return data
+        if data is None:
+            _LOGGER.debug("Cached blob for %s was removed from disk", key)
+            self._remove(key)
+        else:
+            self._index.move_to_end(key)
+        self._store.async_delay_save(self._data_to_save, CACHE_SAVE_DELAY)
+        return data
+
+    async def async_set(self, key: str, data: bytes) -> None:
+        """Cache a blob, evicting the least recently used ones over the cap."""
+        await self._async_load()
+        digest = hashlib.sha256(data).hexdigest()
+        evicted: list[str] = []
+        if key in self._index:
+            if self._index[key][0] == digest:
+                self._index.move_to_end(key)
+                return
+            if (old_digest := self._remove(key)) is not None:
+                evicted.append(old_digest)
+
+        if self._add(key, digest, len(data)):
+            await self._hass.async_add_executor_job(self._write, digest, data)
+
+        while self._size > self._max_size and len(self._index) > 1:
+            oldest = next(iter(self._index))
+            if (old_digest := self._remove(oldest)) is not None:
+                evicted.append(old_digest)
+        if evicted:
+            await self._hass.async_add_executor_job(self._delete, evicted)
+        self._store.async_delay_save(self._data_to_save, CACHE_SAVE_DELAY)
+
+    async def async_get_or_fetch(
+        self, key: str, fetch: Callable[[], Awaitable[bytes | None]]
+    ) -> bytes | None:
+        """Get a cached blob, fetching and caching it once on a miss.
+
+        Concurrent misses for the same key share a single fetch.
+        """
+        if (data := await self.async_get(key)) is not None:
+            return data
+        if (pending := self._pending.get(key)) is not None:
+            return await pending
+
+        future: asyncio.Future[bytes | None] = self._hass.loop.create_future()
+        self._pending[key] = future
+        try:
+            data = await fetch()
+            if data is not None:
+                await self.async_set(key, data)
+        except Exception as err:  # pylint: disable=broad-except
+            future.set_exception(err)
+            # waiters re-raise, do not log it again when nobody awaited it
+            future.exception()
+            raise
+        else:
+            future.set_result(data)
+        finally:
+            del self._pending[key]
+        return data
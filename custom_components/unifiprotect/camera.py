@@ -1,15 +1,18 @@
 """Support for Ubiquiti's UniFi Protect NVR."""
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 import logging
 
 from homeassistant.components.camera import SUPPORT_STREAM, Camera
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pyunifiprotect.api import ProtectApiClient
 from pyunifiprotect.data import Camera as UFPCamera, StateType
+from pyunifiprotect.data.base import ProtectAdoptableDeviceModel, ProtectDeviceModel
 from pyunifiprotect.data.devices import CameraChannel
 
 from .const import (
@@ -19,18 +22,24 @@ from .const import (
     ATTR_HEIGHT,
     ATTR_WIDTH,
     DOMAIN,
+    SIGNAL_OPTIONS,
 )
 from .data import ProtectData
 from .entity import ProtectDeviceEntity
+from .profiler import profile_platform
 
 _LOGGER = logging.getLogger(__name__)
 
 
 def get_camera_channels(
     protect: ProtectApiClient,
+    ufp_device: UFPCamera | None = None,
 ) -> Generator[tuple[UFPCamera, CameraChannel, bool], None, None]:
-    """Get all the camera channels."""
-    for camera in protect.bootstrap.cameras.values():
+    """Get all the camera channels, or only the ones of the given camera."""
+    cameras: Iterable[UFPCamera] = protect.bootstrap.cameras.values()
+    if ufp_device is not None:
+        cameras = [ufp_device]
+    for camera in cameras:
         if not camera.channels:
             _LOGGER.warning(
                 "Camera does not have any channels: %s (id: %s)", camera.name, camera.id
@@ -50,6 +59,7 @@ def get_camera_channels(
             yield camera, camera.channels[0], True
 
 
+@profile_platform(Platform.CAMERA)
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -57,24 +67,51 @@ async def async_setup_entry(
 ) -> None:
     """Discover cameras on a UniFi Protect NVR."""
     data: ProtectData = hass.data[DOMAIN][entry.entry_id]
-    disable_stream = data.disable_stream
 
-    entities = []
-    for camera, channel, is_default in get_camera_channels(data.api):
+    @callback
+    def _add_new_device(device: ProtectAdoptableDeviceModel) -> None:
+        async_add_entities(async_device_entities(data, device))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, data.adopt_signal, _add_new_device)
+    )
+
+    async_add_entities(data.async_pop_entities(Platform.CAMERA, async_device_entities))
+
+
+@callback
+def async_device_entities(
+    data: ProtectData, device: ProtectDeviceModel
+) -> list[ProtectDeviceEntity]:
+    """Build the cameras of a device, one or two for each channel."""
+    if not isinstance(device, UFPCamera):
+        return []
+
+    disable_stream = data.disable_stream
+    entities: list[ProtectDeviceEntity] = []
+    for camera, channel, is_default in get_camera_channels(data.api, device):
+        unique_id = f"{camera.id}_{channel.id}"
         # do not enable streaming for package camera
         # 2 FPS causes a lot of buferring
-        entities.append(
-            ProtectCamera(
-                data,
-                camera,
-                channel,
-                is_default,
-                True,
-                disable_stream or channel.is_package,
+        if not data.async_is_entity_disabled(Platform.CAMERA, unique_id):
+            entities.append(
+                ProtectCamera(
+                    data,
+                    camera,
+                    channel,
+                    is_default,
+                    True,
+                    disable_stream or channel.is_package,
+                )
             )
-        )
 
-        if channel.is_rtsp_enabled and not channel.is_package:
+        if (
+            channel.is_rtsp_enabled
+            and not channel.is_package
+            and not data.async_is_entity_disabled(
+                Platform.CAMERA, f"{unique_id}_insecure"
+            )
+        ):
             entities.append(
                 ProtectCamera(
                     data,
@@ -85,7 +122,7 @@ async def async_setup_entry(
                     disable_stream,
                 )
             )
-    async_add_entities(entities)
+    return entities
 
 
 class ProtectCamera(ProtectDeviceEntity, Camera):
@@ -118,6 +155,25 @@ class ProtectCamera(ProtectDeviceEntity, Camera):
         # only the default (first) channel is enabled by default
         self._attr_entity_registry_enabled_default = is_default and secure
 
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.data.async_subscribe_device_id(
+                SIGNAL_OPTIONS, self._async_updated_options
+            )
+        )
+
+    @callback
+    def _async_updated_options(self) -> None:
+        disable_stream = self.data.disable_stream or self.channel.is_package
+        if disable_stream == self._disable_stream:
+            return
+
+        self._disable_stream = disable_stream
+        self._async_set_stream_source()
+        self.async_write_ha_state()
+
     @callback
     def _async_set_stream_source(self) -> None:
         disable_stream = self._disable_stream
@@ -1,10 +1,10 @@
 """Config Flow to configure UniFi Protect Integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 import logging
 from typing import Any
 
-from aiohttp import CookieJar
 from homeassistant import config_entries
 from homeassistant.const import (
     CONF_HOST,
@@ -16,24 +16,47 @@ from homeassistant.const import (
 )
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
-from pyunifiprotect import NotAuthorized, NvrError, ProtectApiClient
+from pyunifiprotect import NotAuthorized, NvrError
 from pyunifiprotect.data.nvr import NVR
 import voluptuous as vol
 
 from .const import (
     CONF_ALL_UPDATES,
     CONF_DISABLE_RTSP,
+    CONF_EVENT_RETENTION,
+    CONF_KEEPALIVE,
+    CONF_MAX_CONNECTIONS,
     CONF_OVERRIDE_CHOST,
+    CONF_PROFILE_STARTUP,
+    CONF_RATE_WINDOW,
+    CONF_STATS_FILTER,
+    DEFAULT_EVENT_RETENTION,
+    DEFAULT_KEEPALIVE,
+    DEFAULT_MAX_CONNECTIONS,
     DEFAULT_PORT,
+    DEFAULT_RATE_WINDOW,
     DEFAULT_VERIFY_SSL,
     DOMAIN,
     MIN_REQUIRED_PROTECT_V,
     OUTDATED_LOG_MESSAGE,
 )
+from .session import async_get_session_manager
+from .stats import parse_stats_policy
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_OPTIONS: dict[str, Any] = {
+    CONF_DISABLE_RTSP: False,
+    CONF_ALL_UPDATES: False,
+    CONF_OVERRIDE_CHOST: False,
+    CONF_RATE_WINDOW: DEFAULT_RATE_WINDOW,
+    CONF_EVENT_RETENTION: DEFAULT_EVENT_RETENTION,
+    CONF_STATS_FILTER: "",
+    CONF_PROFILE_STARTUP: False,
+    CONF_MAX_CONNECTIONS: DEFAULT_MAX_CONNECTIONS,
+    CONF_KEEPALIVE: DEFAULT_KEEPALIVE,
+}
+
 
 class ProtectFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a UniFi Protect config flow."""
@@ -59,38 +82,22 @@ class ProtectFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_create_entry(
             title=title,
             data={**data, CONF_ID: title},
-            options={
-                CONF_DISABLE_RTSP: False,
-                CONF_ALL_UPDATES: False,
-                CONF_OVERRIDE_CHOST: False,
-            },
+            options=dict(DEFAULT_OPTIONS),
         )
 
     async def _async_get_nvr_data(
         self,
         user_input: dict[str, Any],
+        options: Mapping[str, Any] = DEFAULT_OPTIONS,
     ) -> tuple[NVR | None, dict[str, str]]:
-        session = async_create_clientsession(
-            self.hass, cookie_jar=CookieJar(unsafe=True)
-        )
-
-        host = user_input[CONF_HOST]
-        port = user_input.get(CONF_PORT, DEFAULT_PORT)
-        verify_ssl = user_input.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL)
-
-        protect = ProtectApiClient(
-            session=session,
-            host=host,
-            port=port,
-            username=user_input[CONF_USERNAME],
-            password=user_input[CONF_PASSWORD],
-            verify_ssl=verify_ssl,
-        )
+        # the session stays warm, so the entry reuses the validated login
+        sessions = async_get_session_manager(self.hass)
+        session = sessions.async_acquire(user_input, options)
 
         errors = {}
         nvr_data = None
         try:
-            nvr_data = await protect.get_nvr()
+            nvr_data = await session.api.get_nvr()
         except NotAuthorized as ex:
             _LOGGER.debug(ex)
             errors[CONF_PASSWORD] = "invalid_auth"
@@ -105,6 +112,8 @@ class ProtectFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                     MIN_REQUIRED_PROTECT_V,
                 )
                 errors["base"] = "protect_version"
+        finally:
+            sessions.async_release(session)
 
         return nvr_data, errors
 
@@ -127,7 +136,7 @@ class ProtectFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             form_data.update(user_input)
 
             # validate login data
-            _, errors = await self._async_get_nvr_data(form_data)
+            _, errors = await self._async_get_nvr_data(form_data, self.entry.options)
             if not errors:
                 self.hass.config_entries.async_update_entry(self.entry, data=form_data)
                 await self.hass.config_entries.async_reload(self.entry.entry_id)
@@ -195,8 +204,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            try:
+                parse_stats_policy(user_input.get(CONF_STATS_FILTER, ""))
+            except ValueError as err:
+                _LOGGER.debug("Invalid stats filter: %s", err)
+                errors[CONF_STATS_FILTER] = "invalid_stats_filter"
+            else:
+                return self.async_create_entry(title="", data=user_input)
 
         return self.async_show_form(
             step_id="init",
@@ -216,6 +232,41 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             CONF_OVERRIDE_CHOST, False
                         ),
                     ): bool,
+                    vol.Optional(
+                        CONF_RATE_WINDOW,
+                        default=self.config_entry.options.get(
+                            CONF_RATE_WINDOW, DEFAULT_RATE_WINDOW
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                    vol.Optional(
+                        CONF_EVENT_RETENTION,
+                        default=self.config_entry.options.get(
+                            CONF_EVENT_RETENTION, DEFAULT_EVENT_RETENTION
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=365)),
+                    vol.Optional(
+                        CONF_STATS_FILTER,
+                        default=self.config_entry.options.get(CONF_STATS_FILTER, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_MAX_CONNECTIONS,
+                        default=self.config_entry.options.get(
+                            CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+                    vol.Optional(
+                        CONF_KEEPALIVE,
+                        default=self.config_entry.options.get(
+                            CONF_KEEPALIVE, DEFAULT_KEEPALIVE
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=300)),
+                    vol.Optional(
+                        CONF_PROFILE_STARTUP,
+                        default=self.config_entry.options.get(
+                            CONF_PROFILE_STARTUP, False
+                        ),
+                    ): bool,
                 }
             ),
+            errors=errors,
         )
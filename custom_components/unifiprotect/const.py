@@ -14,23 +14,39 @@ ATTR_CHANNEL_ID = "channel_id"
 ATTR_MESSAGE = "message"
 ATTR_DURATION = "duration"
 ATTR_ANONYMIZE = "anonymize"
+ATTR_CAMERA_ID = "camera_id"
+ATTR_TIMESTAMP = "timestamp"
 
 CONF_DOORBELL_TEXT = "doorbell_text"
 CONF_DISABLE_RTSP = "disable_rtsp"
 CONF_ALL_UPDATES = "all_updates"
 CONF_OVERRIDE_CHOST = "override_connection_host"
+CONF_RATE_WINDOW = "rate_window"
+CONF_EVENT_RETENTION = "event_retention"
+CONF_STATS_FILTER = "stats_filter"
+CONF_PROFILE_STARTUP = "profile_startup"
+CONF_MAX_CONNECTIONS = "max_connections"
+CONF_KEEPALIVE = "keepalive"
 
 CONFIG_OPTIONS = [
     CONF_ALL_UPDATES,
     CONF_DISABLE_RTSP,
     CONF_OVERRIDE_CHOST,
 ]
+# options the API client connects with, changing them reloads the entry
+CONNECTION_OPTIONS = {CONF_OVERRIDE_CHOST, CONF_MAX_CONNECTIONS, CONF_KEEPALIVE}
+# options only read while the entry is set up, changing them reloads the entry
+RELOAD_OPTIONS = CONNECTION_OPTIONS | {CONF_PROFILE_STARTUP}
 
 DEFAULT_PORT = 443
 DEFAULT_ATTRIBUTION = "Powered by UniFi Protect Server"
 DEFAULT_BRAND = "Ubiquiti"
 DEFAULT_SCAN_INTERVAL = 5
 DEFAULT_VERIFY_SSL = False
+DEFAULT_RATE_WINDOW = 60
+DEFAULT_EVENT_RETENTION = 30
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_KEEPALIVE = 15
 
 DEVICES_THAT_ADOPT = {
     ModelType.CAMERA,
@@ -46,6 +62,18 @@ OUTDATED_LOG_MESSAGE = "You are running v%s of UniFi Protect. Minimum required v
 
 TYPE_EMPTY_VALUE = ""
 
+EVENT_DOORBELL_RING = f"{DOMAIN}_doorbell_ring"
+EVENT_PROTECT = f"{DOMAIN}_event"
+EVENT_QUERY_EVENTS_RESULT = f"{DOMAIN}_query_events_result"
+
+# subscription keys for data not tied to a single Protect device
+SIGNAL_AGGREGATES = "nvr_aggregates"
+SIGNAL_DETECTIONS = "detection_counts"
+SIGNAL_DIAGNOSTICS = "nvr_diagnostics"
+SIGNAL_LIVEVIEWS = "liveviews"
+SIGNAL_OPTIONS = "options"
+SIGNAL_RING = "ring"
+
 PLATFORMS = [
     Platform.BINARY_SENSOR,
     Platform.BUTTON,
@@ -57,3 +85,39 @@ PLATFORMS = [
     Platform.SENSOR,
     Platform.SWITCH,
 ]
+# platforms that can have entities for each type of device
+NVR_PLATFORMS = {Platform.BINARY_SENSOR, Platform.SENSOR}
+DEVICE_PLATFORMS = {
+    ModelType.CAMERA: {
+        Platform.BINARY_SENSOR,
+        Platform.BUTTON,
+        Platform.CAMERA,
+        Platform.NUMBER,
+        Platform.SELECT,
+        Platform.SENSOR,
+        Platform.SWITCH,
+    },
+    ModelType.LIGHT: {
+        Platform.BINARY_SENSOR,
+        Platform.BUTTON,
+        Platform.LIGHT,
+        Platform.NUMBER,
+        Platform.SELECT,
+        Platform.SENSOR,
+        Platform.SWITCH,
+    },
+    ModelType.SENSOR: {
+        Platform.BINARY_SENSOR,
+        Platform.BUTTON,
+        Platform.NUMBER,
+        Platform.SELECT,
+        Platform.SENSOR,
+        Platform.SWITCH,
+    },
+    ModelType.VIEWPORT: {
+        Platform.BUTTON,
+        Platform.SELECT,
+        Platform.SENSOR,
+        Platform.SWITCH,
+    },
+}
@@ -1,27 +1,98 @@
 """Base class for protect data."""
 from __future__ import annotations
 
-from collections.abc import Generator, Iterable
+import asyncio
+from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
 from datetime import timedelta
 import logging
+import time
 from typing import Any
+from uuid import UUID
 
+from aiohttp import ClientError
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.const import Platform
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event as HassEvent,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util.dt import utcnow
 from pyunifiprotect import NotAuthorized, NvrError, ProtectApiClient
 from pyunifiprotect.data import (
+    NVR,
     Bootstrap,
+    Camera,
     Event,
+    EventType,
     Liveview,
     ModelType,
     WSSubscriptionMessage,
 )
 from pyunifiprotect.data.base import ProtectAdoptableDeviceModel, ProtectDeviceModel
+from pyunifiprotect.data.websocket import WSAction
 
-from .const import CONF_DISABLE_RTSP, DEVICES_THAT_ADOPT, DEVICES_WITH_ENTITIES
+from .const import (
+    ATTR_CAMERA_ID,
+    ATTR_TIMESTAMP,
+    CONF_ALL_UPDATES,
+    CONF_DISABLE_RTSP,
+    CONF_EVENT_RETENTION,
+    CONF_PROFILE_STARTUP,
+    CONF_RATE_WINDOW,
+    CONF_STATS_FILTER,
+    DEFAULT_EVENT_RETENTION,
+    DEFAULT_RATE_WINDOW,
+    DEVICE_PLATFORMS,
+    DEVICES_FOR_SUBSCRIBE,
+    DEVICES_THAT_ADOPT,
+    DEVICES_WITH_ENTITIES,
+    DOMAIN,
+    EVENT_DOORBELL_RING,
+    EVENT_PROTECT,
+    NVR_PLATFORMS,
+    RELOAD_OPTIONS,
+    SIGNAL_AGGREGATES,
+    SIGNAL_DETECTIONS,
+    SIGNAL_DIAGNOSTICS,
+    SIGNAL_LIVEVIEWS,
+    SIGNAL_OPTIONS,
+    SIGNAL_RING,
+)
+from .events import async_build_event_payload
+from .journal import ProtectEventJournal
+from .profiler import StartupProfiler
+from .session import ProtectSession
+from .stats import (
+    DETECTION_WINDOWS,
+    STATS_POLICY_ALL,
+    STATS_POLICY_NONE,
+    DetectionCounters,
+    ProtectAggregates,
+    ProtectMetrics,
+    StatsFilter,
+)
+from .utils import Liveness, LoopBudget, TimerWheel, get_nested_attr
 
 _LOGGER = logging.getLogger(__name__)
+DETECTIONS_INTERVAL = timedelta(minutes=1)
+DISPATCH_INTEGRATION = "integration"
+METRICS_INTERVAL = timedelta(minutes=1)
+MAX_POLL_INTERVAL = timedelta(minutes=5)
+POLL_MODE_BACKOFF = "backoff"
+POLL_MODE_FAST = "fast"
+REFRESH_TIMEOUT = 60
+# event loop seconds per second each NVR may spend on Websocket updates
+WS_LOOP_BUDGET = 0.05
+
+# builds the entities of one platform for the NVR or an adoptable device
+EntityFactory = Callable[["ProtectData", ProtectDeviceModel], Sequence[Entity]]
 
 
 class ProtectData:
@@ -33,6 +104,7 @@ class ProtectData:
         protect: ProtectApiClient,
         update_interval: timedelta,
         entry: ConfigEntry,
+        session: ProtectSession,
     ) -> None:
         """Initialize an subscriber."""
         super().__init__()
@@ -44,15 +116,144 @@ class ProtectData:
         self._subscriptions: dict[str, list[CALLBACK_TYPE]] = {}
         self._unsub_interval: CALLBACK_TYPE | None = None
         self._unsub_websocket: CALLBACK_TYPE | None = None
+        self._unsub_detections: CALLBACK_TYPE | None = None
+        self._unsub_metrics: CALLBACK_TYPE | None = None
+        self._unsub_registry: CALLBACK_TYPE | None = None
+        self._muted_devices: set[str] = set()
+        self._unsub_backlog: CALLBACK_TYPE | None = None
+        self._backlog: dict[str, WSSubscriptionMessage] = {}
+        self._refreshing = False
+        self._device_types: dict[str, str] = {}
+        self._device_macs: dict[str, str] = {}
+        self._mac_devices: dict[str, str] = {}
+        self._capabilities: dict[str, dict[str, bool]] = {}
+        self._entities: dict[Platform, list[Entity]] = {}
+        self._traffic = session.traffic
+        self._entry_data = dict(entry.data)
+        self._options = dict(entry.options)
 
         self.last_update_success = False
+        self.last_update_id: UUID | None = None
+        self.reconnect_time: float | None = None
+        self.reconnect_bytes: int | None = None
+        self.full_refreshes = 0
+        self.liveness = Liveness()
+        self.poll_mode = POLL_MODE_FAST
+        self.poll_interval = update_interval.total_seconds()
+        self._last_poll = 0.0
+        self.metrics = ProtectMetrics()
+        self.budget = LoopBudget(WS_LOOP_BUDGET)
+        self.stats_filter = self._async_create_stats_filter()
+        self.platforms: set[Platform] = set()
+        self.profiler = StartupProfiler(
+            entry.title, entry.options.get(CONF_PROFILE_STARTUP, False)
+        )
         self.api = protect
+        self.session = session
+        self._async_update_ignore_stats()
+        self.aggregates = ProtectAggregates(self.rate_window.total_seconds())
+        self.detections: dict[str, DetectionCounters] = {}
+        self.timers = TimerWheel(hass.loop)
+        # time from websocket receipt to the doorbell being signalled, local only
+        self.ring_latency: float | None = None
+        self._ws_received = 0.0
+        self.journal = ProtectEventJournal(
+            hass,
+            hass.config.path(STORAGE_DIR, f"{DOMAIN}_{entry.entry_id}_events.db"),
+            self.event_retention,
+        )
+
+    @property
+    def entry_id(self) -> str:
+        """Id of the config entry for this NVR."""
+        return self._entry.entry_id
 
     @property
     def disable_stream(self) -> bool:
         """Check if RTSP is disabled."""
         return self._entry.options.get(CONF_DISABLE_RTSP, False)
 
+    @property
+    def rate_window(self) -> timedelta:
+        """Window used to average rates derived from byte counters."""
+        return timedelta(
+            seconds=self._entry.options.get(CONF_RATE_WINDOW, DEFAULT_RATE_WINDOW)
+        )
+
+    @property
+    def event_retention(self) -> timedelta:
+        """How long events are kept in the local event journal."""
+        return timedelta(
+            days=self._entry.options.get(CONF_EVENT_RETENTION, DEFAULT_EVENT_RETENTION)
+        )
+
+    @callback
+    def _async_create_stats_filter(self) -> StatsFilter:
+        default = STATS_POLICY_NONE
+        if self._entry.options.get(CONF_ALL_UPDATES, False):
+            default = STATS_POLICY_ALL
+        try:
+            return StatsFilter(self._entry.options.get(CONF_STATS_FILTER, ""), default)
+        except ValueError as err:
+            _LOGGER.warning("Ignoring invalid stats filter: %s", err)
+            return StatsFilter("", default)
+
+    @callback
+    def async_apply_options(self) -> bool:
+        """Push changed options to the live objects.
+
+        Returns False without applying anything if the connection data, a
+        connection option or startup profiling changed, those need the entry
+        to be reloaded.
+        """
+        options = self._entry.options
+        changed = {
+            key
+            for key in options.keys() | self._options.keys()
+            if options.get(key) != self._options.get(key)
+        }
+        if self._entry.data != self._entry_data or changed & RELOAD_OPTIONS:
+            return False
+
+        _LOGGER.debug("Applying changed options: %s", changed)
+        self._options = dict(options)
+        if changed & {CONF_ALL_UPDATES, CONF_STATS_FILTER}:
+            self.stats_filter = self._async_create_stats_filter()
+            self._async_update_ignore_stats()
+        if CONF_RATE_WINDOW in changed:
+            self.aggregates = ProtectAggregates(self.rate_window.total_seconds())
+            self._async_update_aggregates()
+        if CONF_EVENT_RETENTION in changed:
+            self.journal.retention = self.event_retention
+        self.async_signal_device_id_update(SIGNAL_OPTIONS)
+        return True
+
+    @callback
+    def _async_update_ignore_stats(self) -> None:
+        # stats are filtered by ProtectData when there is a stats filter
+        # pylint: disable=protected-access
+        self.api._ignore_stats = not (
+            self._options.get(CONF_ALL_UPDATES, False)
+            or self._options.get(CONF_STATS_FILTER)
+        )
+
+    @property
+    def adopt_signal(self) -> str:
+        """Dispatcher signal sent with each newly adopted device."""
+        return f"{DOMAIN}_{self._entry.entry_id}_adopt"
+
+    @property
+    def bytes_fetched(self) -> int:
+        """Total bytes received from the NVR API."""
+        return self._traffic.bytes_received
+
+    @property
+    def last_message_age(self) -> float | None:
+        """Seconds since the last Websocket message."""
+        if self.liveness.last is None:
+            return None
+        return time.monotonic() - self.liveness.last
+
     def get_by_types(
         self, device_types: Iterable[ModelType]
     ) -> Generator[ProtectAdoptableDeviceModel, None, None]:
@@ -65,12 +266,134 @@ class ProtectData:
             )
             yield from devices.values()
 
+    @callback
+    def async_has_capability(self, device: ProtectDeviceModel, field: str) -> bool:
+        """Check if the (nested) field of a device is truthy.
+
+        Results are cached per device until its feature flags change or the
+        next full refresh.
+        """
+        capabilities = self._capabilities.setdefault(device.id, {})
+        if (value := capabilities.get(field)) is None:
+            value = capabilities[field] = bool(get_nested_attr(device, field))
+        return value
+
+    @callback
+    def async_get_device_id(self, mac: str) -> str | None:
+        """Get the ID of the adopted device with a MAC address."""
+        return self._mac_devices.get(mac)
+
+    @callback
+    def async_is_entity_disabled(self, platform: str, unique_id: str) -> bool:
+        """Check if an entity is disabled in the entity registry.
+
+        Disabled entities are not built at all, the registry entry stands in
+        for them. Enabling one reloads the config entry, which builds it.
+        """
+        registry = er.async_get(self._hass)
+        entity_id = registry.async_get_entity_id(platform, DOMAIN, unique_id)
+        if entity_id is None:
+            return False
+        entity = registry.async_get(entity_id)
+        return entity is not None and entity.disabled
+
+    @callback
+    def async_get_platforms(self) -> set[Platform]:
+        """Get the platforms that have entities for the devices in the bootstrap."""
+        platforms = set(NVR_PLATFORMS)
+        for device in self.get_by_types(DEVICES_THAT_ADOPT):
+            platforms |= self._async_get_device_platforms(device)
+        return platforms
+
+    @callback
+    def _async_get_device_platforms(
+        self, device: ProtectAdoptableDeviceModel
+    ) -> set[Platform]:
+        assert device.model is not None
+        platforms = DEVICE_PLATFORMS[device.model]
+        if isinstance(device, Camera) and device.feature_flags.has_speaker:
+            platforms = platforms | {Platform.MEDIA_PLAYER}
+        return platforms
+
+    @callback
+    def async_build_entities(self, factories: Mapping[Platform, EntityFactory]) -> None:
+        """Build the entities of all platforms in one pass over the bootstrap.
+
+        Each platform takes its own entities with `async_pop_entities` once it
+        is set up.
+        """
+        started = time.perf_counter()
+        self._entities = self._async_build_entities(factories, self.platforms)
+        _LOGGER.debug(
+            "Built %s entities in %.1fms",
+            sum(len(entities) for entities in self._entities.values()),
+            (time.perf_counter() - started) * 1000,
+        )
+
+    @callback
+    def async_pop_entities(
+        self, platform: Platform, factory: EntityFactory
+    ) -> list[Entity]:
+        """Take the entities built for a platform.
+
+        Platforms set up after the entry, once the first device of a new type
+        is adopted, build their entities from the bootstrap instead.
+        """
+        if (entities := self._entities.pop(platform, None)) is None:
+            built = self._async_build_entities({platform: factory}, {platform})
+            entities = built[platform]
+        return entities
+
+    @callback
+    def _async_build_entities(
+        self, factories: Mapping[Platform, EntityFactory], platforms: set[Platform]
+    ) -> dict[Platform, list[Entity]]:
+        entities: dict[Platform, list[Entity]] = {
+            platform: [] for platform in platforms
+        }
+        nvr = self.api.bootstrap.nvr
+        for platform in NVR_PLATFORMS & platforms:
+            entities[platform] += factories[platform](self, nvr)
+        for device in self.get_by_types(DEVICES_THAT_ADOPT):
+            for platform in self._async_get_device_platforms(device) & platforms:
+                entities[platform] += factories[platform](self, device)
+        return entities
+
+    @callback
+    def _async_add_missing_platforms(self) -> None:
+        """Set up platforms that got entities after the entry was set up."""
+        # initial platforms are not forwarded yet
+        if not self.platforms:
+            return
+
+        for platform in self.async_get_platforms() - self.platforms:
+            _LOGGER.debug("Setting up %s platform for new devices", platform)
+            self.platforms.add(platform)
+            self._hass.async_create_task(
+                self._hass.config_entries.async_forward_entry_setup(
+                    self._entry, platform
+                )
+            )
+
     async def async_setup(self) -> None:
         """Subscribe and do the refresh."""
+        await self.journal.async_setup()
+        await self._async_seed_detections()
         self._unsub_websocket = self.api.subscribe_websocket(
             self._async_process_ws_message
         )
         await self.async_refresh()
+        self._async_update_aggregates()
+        # rolling detection counts decay even if no new events come in
+        self._unsub_detections = async_track_time_interval(
+            self._hass, self._async_signal_detections, DETECTIONS_INTERVAL
+        )
+        self._unsub_metrics = async_track_time_interval(
+            self._hass, self._async_publish_metrics, METRICS_INTERVAL
+        )
+        self._unsub_registry = self._hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+        )
 
     async def async_stop(self, *args: Any) -> None:
         """Stop processing data."""
@@ -80,36 +403,261 @@ class ProtectData:
         if self._unsub_interval:
             self._unsub_interval()
             self._unsub_interval = None
+        if self._unsub_detections:
+            self._unsub_detections()
+            self._unsub_detections = None
+        if self._unsub_metrics:
+            self._unsub_metrics()
+            self._unsub_metrics = None
+        if self._unsub_registry:
+            self._unsub_registry()
+            self._unsub_registry = None
+        if self._unsub_backlog:
+            self._unsub_backlog()
+            self._unsub_backlog = None
+        self._backlog.clear()
+        self.timers.stop()
+        self.profiler.async_stop()
         await self.api.async_disconnect_ws()
+        await self.journal.async_stop()
 
     async def async_refresh(self, *_: Any, force: bool = False) -> None:
         """Update the data."""
+        # a slow NVR must not pile up refreshes, skip until the last one is done
+        if self._refreshing:
+            _LOGGER.debug("Refresh still in progress, skipping")
+            return
+
+        self._refreshing = True
+        try:
+            await self._async_refresh(force)
+        finally:
+            self._refreshing = False
 
+    async def _async_refresh(self, force: bool) -> None:
         # if last update was failure, force until success
         if not self.last_update_success:
             force = True
 
+        started: float | None = None
+        fetched = self.bytes_fetched
+        if not force and self.last_update_id is not None and not self.api.check_ws():
+            started = time.monotonic()
+            if await self._async_resume_websocket():
+                self._async_record_reconnect(started, fetched)
+                return
+            # the NVR may no longer have updates since the last one we processed
+            _LOGGER.debug("Could not resume Websocket, fetching full bootstrap")
+            force = True
+
+        if force:
+            self.full_refreshes += 1
+        refresh_started = time.monotonic()
         try:
-            updates = await self.api.update(force=force)
-        except NvrError:
-            if self.last_update_success:
-                _LOGGER.exception("Error while updating")
+            updates = await asyncio.wait_for(
+                self.api.update(force=force), REFRESH_TIMEOUT
+            )
+        except (asyncio.TimeoutError, NvrError):
+            was_successful = self.last_update_success
             self.last_update_success = False
-            # manually trigger update to mark entities unavailable
-            self._async_process_updates(self.api.bootstrap)
+            # mark entities unavailable once, not on every failed poll
+            if was_successful:
+                _LOGGER.exception("Error while updating")
+                self._async_process_updates(self.api.bootstrap)
         except NotAuthorized:
             await self.async_stop()
             _LOGGER.exception("Reauthentication required")
             self._entry.async_start_reauth(self._hass)
             self.last_update_success = False
         else:
+            self.metrics.refresh_time = (time.monotonic() - refresh_started) * 1000
             self.last_update_success = True
             self._async_process_updates(updates)
+            if started is not None:
+                self._async_record_reconnect(started, fetched)
+
+    async def _async_poll(self, *_: Any) -> None:
+        """Refresh, backing off while the Websocket is delivering messages."""
+        now = time.monotonic()
+        base_interval = self._update_interval.total_seconds()
+        if not (self.api.check_ws() and self.liveness.is_alive(now)):
+            if self.poll_mode != POLL_MODE_FAST:
+                _LOGGER.debug("Websocket went stale, polling every %ss", base_interval)
+                self.poll_mode = POLL_MODE_FAST
+                self.poll_interval = base_interval
+                self.async_signal_device_id_update(SIGNAL_DIAGNOSTICS)
+        elif now - self._last_poll < self.poll_interval:
+            return
+        else:
+            interval = min(self.poll_interval * 2, MAX_POLL_INTERVAL.total_seconds())
+            if self.poll_mode != POLL_MODE_BACKOFF or interval != self.poll_interval:
+                self.poll_mode = POLL_MODE_BACKOFF
+                self.poll_interval = interval
+                self.async_signal_device_id_update(SIGNAL_DIAGNOSTICS)
+
+        self._last_poll = now
+        await self.async_refresh()
+
+    async def _async_resume_websocket(self) -> bool:
+        """Reconnect the Websocket from the last processed update.
+
+        The NVR replays everything after ``lastUpdateId`` when the Websocket
+        connects, so no bootstrap is needed. If it no longer has that update
+        it refuses the connection.
+        """
+        _LOGGER.debug("Resuming Websocket from update %s", self.last_update_id)
+        bootstrap = self.api.bootstrap
+        previous_update_id = bootstrap.last_update_id
+        bootstrap.last_update_id = self.last_update_id
+        try:
+            await self.api.async_disconnect_ws()
+            await asyncio.wait_for(
+                self.api.async_connect_ws(force=True), REFRESH_TIMEOUT
+            )
+        except (asyncio.TimeoutError, ClientError, NvrError) as err:
+            _LOGGER.debug("Error while resuming Websocket: %s", err)
+        else:
+            if self.api.check_ws():
+                return True
+        # the update was never applied, it must not be resumed from later on
+        bootstrap.last_update_id = previous_update_id
+        return False
+
+    @callback
+    def _async_record_reconnect(self, started: float, fetched: int) -> None:
+        self.metrics.reconnects += 1
+        self.reconnect_time = (time.monotonic() - started) * 1000
+        self.reconnect_bytes = self.bytes_fetched - fetched
+        _LOGGER.debug(
+            "Reconnected in %sms, fetched %s bytes",
+            self.reconnect_time,
+            self.reconnect_bytes,
+        )
+        self.async_signal_device_id_update(SIGNAL_DIAGNOSTICS)
 
     @callback
     def _async_process_ws_message(self, message: WSSubscriptionMessage) -> None:
+        started = self._ws_received = time.perf_counter()
+        self.last_update_id = message.new_update_id
+        self.liveness.add()
+        self.metrics.messages += 1
+        # filtered stats are dropped before they can be deferred
+        if not (
+            self._async_is_filtered_stats(message)
+            or self._async_defer_ws_message(message)
+        ):
+            self._async_handle_ws_message(message)
+        elapsed = time.perf_counter() - started
+        self.metrics.processing.add(elapsed)
+        self._async_charge(elapsed)
+
+    @callback
+    def _async_is_filtered_stats(self, message: WSSubscriptionMessage) -> bool:
+        return (
+            message.action == WSAction.UPDATE
+            and message.new_obj.model in DEVICES_WITH_ENTITIES
+            and not self.stats_filter.allow(
+                message.new_obj.model.value, message.new_obj.id, message.changed_data
+            )
+        )
+
+    @callback
+    def _async_charge(self, seconds: float) -> None:
+        """Account event loop time spent on this NVR."""
+        self.metrics.busy += seconds
+        self.budget.add(seconds)
+
+    @callback
+    def _async_defer_ws_message(self, message: WSSubscriptionMessage) -> bool:
+        """Queue device updates while this NVR is over its loop time budget.
+
+        Queued updates of the same device are merged, so a burst costs one
+        dispatch per device once the next budget window starts. The bootstrap
+        is already updated, only the entities see the update later. Rings,
+        events, adds and removes are never deferred.
+        """
+        if message.action == WSAction.REMOVE:
+            if isinstance(message.old_obj, ProtectAdoptableDeviceModel):
+                self._backlog.pop(message.old_obj.id, None)
+            return False
+        if (
+            message.action != WSAction.UPDATE
+            or message.new_obj.model not in DEVICES_WITH_ENTITIES
+            or message.new_obj.id in self._muted_devices
+        ):
+            return False
+
+        device_id = message.new_obj.id
+        if (pending := self._backlog.get(device_id)) is not None:
+            # the newest objects win, the changes of both are dispatched
+            message.changed_data = {**pending.changed_data, **message.changed_data}
+            self._backlog[device_id] = message
+        elif self.budget.exhausted():
+            self._backlog[device_id] = message
+        else:
+            return False
+
+        self.metrics.deferred += 1
+        if self._unsub_backlog is None:
+            self._unsub_backlog = async_call_later(
+                self._hass, self.budget.next_window(), self._async_drain_backlog
+            )
+        return True
+
+    @callback
+    def _async_drain_backlog(self, *_: Any) -> None:
+        self._unsub_backlog = None
+        while self._backlog and not self.budget.exhausted():
+            message = self._backlog.pop(next(iter(self._backlog)))
+            started = time.perf_counter()
+            self._async_handle_ws_message(message)
+            elapsed = time.perf_counter() - started
+            self.metrics.processing.add(elapsed)
+            self._async_charge(elapsed)
+
+        if self._backlog:
+            self._unsub_backlog = async_call_later(
+                self._hass, self.budget.next_window(), self._async_drain_backlog
+            )
+
+    @callback
+    def _async_handle_ws_message(self, message: WSSubscriptionMessage) -> None:
+        # rings skip the generic update chain so the doorbell reacts first
+        if (
+            message.action == WSAction.ADD
+            and isinstance(message.new_obj, Event)
+            and message.new_obj.type == EventType.RING
+            and message.new_obj.camera is not None
+        ):
+            self._async_process_ring(message.new_obj.camera.id, message)
+            return
+
+        if message.action == WSAction.REMOVE:
+            if isinstance(message.old_obj, ProtectAdoptableDeviceModel):
+                self._async_remove_device(message.old_obj.id)
+            return
+
+        if (payload := async_build_event_payload(message)) is not None:
+            self._hass.bus.async_fire(EVENT_PROTECT, payload)
+
         if message.new_obj.model in DEVICES_WITH_ENTITIES:
-            self.async_signal_device_id_update(message.new_obj.id)
+            self._device_types[message.new_obj.id] = message.new_obj.model.value
+            if "feature_flags" in message.changed_data:
+                self._capabilities.pop(message.new_obj.id, None)
+            if isinstance(message.new_obj, ProtectAdoptableDeviceModel):
+                self._async_process_adoption(message)
+            if message.new_obj.id not in self._muted_devices:
+                self.async_signal_device_id_update(message.new_obj.id)
+            if isinstance(message.new_obj, Camera) and self.aggregates.update_camera(
+                message.new_obj
+            ):
+                self.async_signal_device_id_update(SIGNAL_AGGREGATES)
+            elif (
+                isinstance(message.new_obj, NVR)
+                and "storage_stats" in message.changed_data
+            ):
+                self.aggregates.update_nvr(message.new_obj)
+                self.async_signal_device_id_update(SIGNAL_AGGREGATES)
             # trigger update for all Cameras with LCD screens when NVR Doorbell settings updates
             if "doorbell_settings" in message.changed_data:
                 _LOGGER.debug(
@@ -121,19 +669,209 @@ class ProtectData:
                         self.async_signal_device_id_update(camera.id)
         # trigger updates for camera that the event references
         elif isinstance(message.new_obj, Event):
+            self.journal.async_add_event(message.new_obj)
             if message.new_obj.camera is not None:
+                self._async_count_detections(message.new_obj.camera.id, message)
                 self.async_signal_device_id_update(message.new_obj.camera.id)
             elif message.new_obj.light is not None:
                 self.async_signal_device_id_update(message.new_obj.light.id)
             elif message.new_obj.sensor is not None:
                 self.async_signal_device_id_update(message.new_obj.sensor.id)
-        # alert user viewport needs restart so voice clients can get new options
-        elif len(self.api.bootstrap.viewers) > 0 and isinstance(
-            message.new_obj, Liveview
-        ):
-            _LOGGER.warning(
-                "Liveviews updated. Restart Home Assistant to update Viewport select options"
+        # refresh the Liveview options of the Viewport selects
+        elif isinstance(message.new_obj, Liveview):
+            self.async_signal_device_id_update(SIGNAL_LIVEVIEWS)
+
+    @callback
+    def _async_process_adoption(self, message: WSSubscriptionMessage) -> None:
+        device: ProtectAdoptableDeviceModel = message.new_obj
+        adopted = message.changed_data.get("is_adopted_by_us")
+        if message.action == WSAction.ADD or adopted:
+            self._async_add_device(device)
+        elif adopted is False:
+            self._async_remove_device(device.id)
+
+    @callback
+    def _async_add_device(self, device: ProtectAdoptableDeviceModel) -> None:
+        """Add the entities of a device that was not in the bootstrap before."""
+        if device.id in self._device_macs:
+            return
+
+        _LOGGER.debug("Adding entities for new device: %s", device.name)
+        assert device.model is not None
+        self._device_macs[device.id] = device.mac
+        self._mac_devices[device.mac] = device.id
+        self._device_types[device.id] = device.model.value
+        self._async_add_missing_platforms()
+        async_dispatcher_send(self._hass, self.adopt_signal, device)
+        if isinstance(device, Camera) and self.aggregates.update_camera(device):
+            self.async_signal_device_id_update(SIGNAL_AGGREGATES)
+
+    @callback
+    def _async_remove_device(self, device_id: str) -> None:
+        """Remove the entities of a device that was removed or unadopted.
+
+        Removing the config entry from the device in the device registry makes
+        the entity registry remove its entities, which removes them from their
+        platforms as well.
+        """
+        if (mac := self._device_macs.pop(device_id, None)) is None:
+            return
+
+        _LOGGER.debug("Removing entities for device: %s", device_id)
+        self._mac_devices.pop(mac, None)
+        self._device_types.pop(device_id, None)
+        self._capabilities.pop(device_id, None)
+        self.detections.pop(device_id, None)
+        if self.aggregates.remove_camera(device_id):
+            self.async_signal_device_id_update(SIGNAL_AGGREGATES)
+
+        registry = dr.async_get(self._hass)
+        device = registry.async_get_device(
+            set(), {(dr.CONNECTION_NETWORK_MAC, dr.format_mac(mac))}
+        )
+        if device is not None:
+            registry.async_update_device(
+                device.id, remove_config_entry_id=self._entry.entry_id
+            )
+
+    @callback
+    def _async_process_ring(
+        self, camera_id: str, message: WSSubscriptionMessage
+    ) -> None:
+        event: Event = message.new_obj
+        self._hass.bus.async_fire(
+            EVENT_DOORBELL_RING,
+            {ATTR_CAMERA_ID: camera_id, ATTR_TIMESTAMP: event.start.isoformat()},
+        )
+        self.async_signal_device_id_update(f"{camera_id}_{SIGNAL_RING}")
+        if (payload := async_build_event_payload(message)) is not None:
+            self._hass.bus.async_fire(EVENT_PROTECT, payload)
+
+        # NVR event times are not comparable to local time, clocks can be skewed
+        self.ring_latency = (time.perf_counter() - self._ws_received) * 1000
+        _LOGGER.debug(
+            "Doorbell ring for %s signalled in %sms", camera_id, self.ring_latency
+        )
+        self._async_count_detections(camera_id, message)
+        self.journal.async_add_event(event)
+        self.async_signal_device_id_update(SIGNAL_DIAGNOSTICS)
+
+    @callback
+    def _async_count_detections(
+        self, camera_id: str, message: WSSubscriptionMessage
+    ) -> None:
+        event: Event = message.new_obj
+        old_event: Event | None = None
+        if message.action != WSAction.ADD:
+            if not isinstance(message.old_obj, Event):
+                return
+            old_event = message.old_obj
+
+        self.async_get_detections(camera_id).add_event(event, old_event)
+
+    @callback
+    def async_get_detections(self, camera_id: str) -> DetectionCounters:
+        """Get the rolling detection counters for a camera."""
+        if (counters := self.detections.get(camera_id)) is None:
+            counters = self.detections[camera_id] = DetectionCounters()
+        return counters
+
+    async def _async_seed_detections(self) -> None:
+        """Restore the rolling detection counts from the event journal."""
+        longest = max(window for window, _ in DETECTION_WINDOWS.values())
+        rows = await self.journal.async_get_since(utcnow() - timedelta(seconds=longest))
+        # journal timestamps are wall clock, the counters run on monotonic time
+        offset = time.monotonic() - time.time()
+        for row in rows:
+            self.async_get_detections(row["device_id"]).add_record(
+                row["type"],
+                row["smart_detect_types"].split(","),
+                row["start"] + offset,
+            )
+        _LOGGER.debug("Seeded detection counts from %s journal events", len(rows))
+
+    @callback
+    def _async_signal_detections(self, *_: Any) -> None:
+        self.async_signal_device_id_update(SIGNAL_DETECTIONS)
+
+    @callback
+    def _async_entity_registry_updated(self, event: HassEvent) -> None:
+        data = event.data
+        if data["action"] == "update" and "disabled_by" not in data.get("changes", {}):
+            return
+
+        registry = er.async_get(self._hass)
+        entity = registry.async_get(data["entity_id"])
+        if entity is not None and entity.config_entry_id != self._entry.entry_id:
+            return
+        self.async_update_muted_devices()
+
+    @callback
+    def async_update_muted_devices(self) -> None:
+        """Track devices whose entities are all disabled in the registry.
+
+        Entities are matched to devices through the device registry, by MAC
+        address. Devices without any entities in the registry yet (first setup,
+        newly adopted) are not muted. The Websocket only decodes the models of
+        devices that are not muted, see `_async_update_subscribed_models`.
+        """
+        nvr = self.api.bootstrap.nvr
+        macs = {dr.format_mac(nvr.mac): nvr.id}
+        for device_id, mac in self._device_macs.items():
+            macs[dr.format_mac(mac)] = device_id
+
+        device_registry = dr.async_get(self._hass)
+        registry = er.async_get(self._hass)
+        known: set[str] = set()
+        enabled: set[str] = set()
+        for entity in er.async_entries_for_config_entry(registry, self.entry_id):
+            if (
+                entity.device_id is None
+                or (device := device_registry.async_get(entity.device_id)) is None
+            ):
+                continue
+            for connection, mac in device.connections:
+                if connection != dr.CONNECTION_NETWORK_MAC or mac not in macs:
+                    continue
+                known.add(macs[mac])
+                if entity.disabled_by is None:
+                    enabled.add(macs[mac])
+
+        muted = known - enabled
+        if muted != self._muted_devices:
+            _LOGGER.debug("Skipping updates of devices: %s", ", ".join(sorted(muted)))
+            self._muted_devices = muted
+        self._async_update_subscribed_models()
+
+    @callback
+    def _async_update_subscribed_models(self) -> None:
+        """Only decode Websocket updates of models with devices that are not muted.
+
+        The NVR and events are always needed. Adoptable models without any
+        devices stay subscribed so a newly adopted device of that model is
+        seen, a muted model picks up new devices on the next full refresh.
+        """
+        models = DEVICES_FOR_SUBSCRIBE - DEVICES_THAT_ADOPT
+        present: set[ModelType] = set()
+        for device in self.get_by_types(DEVICES_THAT_ADOPT):
+            assert device.model is not None
+            present.add(device.model)
+            if device.id not in self._muted_devices:
+                models.add(device.model)
+        models |= DEVICES_THAT_ADOPT - present
+
+        # pylint: disable=protected-access
+        if models != self.api._subscribed_models:
+            _LOGGER.debug(
+                "Subscribing to models: %s",
+                ", ".join(sorted(model.value for model in models)),
             )
+            self.api._subscribed_models = models
+
+    @callback
+    def _async_publish_metrics(self, *_: Any) -> None:
+        self.metrics.publish()
+        self.async_signal_device_id_update(SIGNAL_DIAGNOSTICS)
 
     @callback
     def _async_process_updates(self, updates: Bootstrap | None) -> None:
@@ -143,12 +881,46 @@ class ProtectData:
         if updates is None:
             return
 
+        started = time.perf_counter()
+        # every device is signalled below, deferred updates are superseded
+        self._backlog.clear()
+        self._capabilities.clear()
+        self._device_types[self.api.bootstrap.nvr.id] = ModelType.NVR.value
         self.async_signal_device_id_update(self.api.bootstrap.nvr.id)
-        for device_type in DEVICES_THAT_ADOPT:
-            attr = f"{device_type.value}s"
-            devices: dict[str, ProtectDeviceModel] = getattr(self.api.bootstrap, attr)
-            for device_id in devices.keys():
-                self.async_signal_device_id_update(device_id)
+        devices = {
+            device.id: device for device in self.get_by_types(DEVICES_THAT_ADOPT)
+        }
+        # before the platforms are set up, the bootstrap devices are the baseline
+        if self.platforms:
+            for device_id in self._device_macs.keys() - devices.keys():
+                self._async_remove_device(device_id)
+            for device_id in devices.keys() - self._device_macs.keys():
+                self._async_add_device(devices[device_id])
+        for device in devices.values():
+            assert device.model is not None
+            self._device_macs[device.id] = device.mac
+            self._mac_devices[device.mac] = device.id
+            self._device_types[device.id] = device.model.value
+        self.async_update_muted_devices()
+        for device in devices.values():
+            if device.id not in self._muted_devices:
+                self.async_signal_device_id_update(device.id)
+        self._async_add_missing_platforms()
+        self._async_update_aggregates()
+        self._async_charge(time.perf_counter() - started)
+
+    @callback
+    def _async_update_aggregates(self) -> None:
+        """Recalculate storage and camera contributions after a full refresh."""
+
+        cameras = self.api.bootstrap.cameras
+        self.aggregates.update_nvr(self.api.bootstrap.nvr)
+        for camera_id in self.aggregates.camera_ids - cameras.keys():
+            self.aggregates.remove_camera(camera_id)
+        for camera in cameras.values():
+            self.aggregates.update_camera(camera)
+        self.aggregates.recalculate()
+        self.async_signal_device_id_update(SIGNAL_AGGREGATES)
 
     @callback
     def async_subscribe_device_id(
@@ -157,7 +929,7 @@ class ProtectData:
         """Add an callback subscriber."""
         if not self._subscriptions:
             self._unsub_interval = async_track_time_interval(
-                self._hass, self.async_refresh, self._update_interval
+                self._hass, self._async_poll, self._update_interval
             )
         self._subscriptions.setdefault(device_id, []).append(update_callback)
 
@@ -185,5 +957,10 @@ class ProtectData:
             return
 
         _LOGGER.debug("Updating device: %s", device_id)
+        started = time.perf_counter()
         for update_callback in self._subscriptions[device_id]:
             update_callback()
+        self.metrics.add_dispatch(
+            self._device_types.get(device_id, DISPATCH_INTEGRATION),
+            time.perf_counter() - started,
+        )
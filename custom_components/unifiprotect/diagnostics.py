@@ -0,0 +1,27 @@
+"""Diagnostics support for UniFi Protect."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .data import ProtectData
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data: ProtectData = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "options": dict(entry.options),
+        "startup_profile": data.profiler.report,
+        "session": {
+            "logins": data.session.logins,
+            "connections_opened": data.session.handshakes,
+            "connections_reused": data.session.traffic.connections_reused,
+            "bytes_received": data.session.traffic.bytes_received,
+        },
+    }
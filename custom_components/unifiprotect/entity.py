@@ -8,86 +8,67 @@ from typing import Any
 from homeassistant.core import callback
 import homeassistant.helpers.device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo, Entity, EntityDescription
-from pyunifiprotect.data import (
-    Camera,
-    Event,
-    Light,
-    ModelType,
-    ProtectAdoptableDeviceModel,
-    Sensor,
-    StateType,
-    Viewer,
-)
+from pyunifiprotect.data import Event, ModelType, ProtectAdoptableDeviceModel, StateType
+from pyunifiprotect.data.base import ProtectDeviceModel
 from pyunifiprotect.data.nvr import NVR
 
-from .const import ATTR_EVENT_SCORE, DEFAULT_ATTRIBUTION, DEFAULT_BRAND, DOMAIN
+from .const import (
+    ATTR_EVENT_SCORE,
+    DEFAULT_ATTRIBUTION,
+    DEFAULT_BRAND,
+    DEVICES_THAT_ADOPT,
+    DOMAIN,
+)
 from .data import ProtectData
 from .models import ProtectRequiredKeysMixin
-from .utils import get_nested_attr
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@callback
-def _async_device_entities(
-    data: ProtectData,
-    klass: type[ProtectDeviceEntity],
-    model_type: ModelType,
-    descs: Sequence[ProtectRequiredKeysMixin],
-) -> list[ProtectDeviceEntity]:
-    if len(descs) == 0:
-        return []
-
-    entities: list[ProtectDeviceEntity] = []
-    for device in data.get_by_types({model_type}):
-        assert isinstance(device, (Camera, Light, Sensor, Viewer))
-        for description in descs:
-            assert isinstance(description, EntityDescription)
-            if description.ufp_required_field:
-                required_field = get_nested_attr(device, description.ufp_required_field)
-                if not required_field:
-                    continue
-
-            entities.append(
-                klass(
-                    data,
-                    device=device,
-                    description=description,
-                )
-            )
-            _LOGGER.debug(
-                "Adding %s entity %s for %s",
-                klass.__name__,
-                description.name,
-                device.name,
-            )
-
-    return entities
-
-
 @callback
 def async_all_device_entities(
     data: ProtectData,
     klass: type[ProtectDeviceEntity],
+    ufp_device: ProtectDeviceModel,
     camera_descs: Sequence[ProtectRequiredKeysMixin] | None = None,
     light_descs: Sequence[ProtectRequiredKeysMixin] | None = None,
     sense_descs: Sequence[ProtectRequiredKeysMixin] | None = None,
     viewer_descs: Sequence[ProtectRequiredKeysMixin] | None = None,
     all_descs: Sequence[ProtectRequiredKeysMixin] | None = None,
+    platform: str | None = None,
 ) -> list[ProtectDeviceEntity]:
-    """Generate a list of all the device entities."""
-    all_descs = list(all_descs or [])
-    camera_descs = list(camera_descs or []) + all_descs
-    light_descs = list(light_descs or []) + all_descs
-    sense_descs = list(sense_descs or []) + all_descs
-    viewer_descs = list(viewer_descs or []) + all_descs
-
-    return (
-        _async_device_entities(data, klass, ModelType.CAMERA, camera_descs)
-        + _async_device_entities(data, klass, ModelType.LIGHT, light_descs)
-        + _async_device_entities(data, klass, ModelType.SENSOR, sense_descs)
-        + _async_device_entities(data, klass, ModelType.VIEWPORT, viewer_descs)
-    )
+    """Generate all the entities of a device.
+
+    Descriptions are looked up by device type and ``ufp_required_field`` is
+    checked against the capabilities cached in ``ProtectData``, so each field
+    is only resolved once per device across all platforms. If the platform is
+    given, entities disabled in the entity registry are skipped.
+    """
+    if ufp_device.model not in DEVICES_THAT_ADOPT:
+        return []
+
+    descs_by_model: dict[ModelType, Sequence[ProtectRequiredKeysMixin] | None] = {
+        ModelType.CAMERA: camera_descs,
+        ModelType.LIGHT: light_descs,
+        ModelType.SENSOR: sense_descs,
+        ModelType.VIEWPORT: viewer_descs,
+    }
+    descs = list(descs_by_model[ufp_device.model] or []) + list(all_descs or [])
+
+    entities: list[ProtectDeviceEntity] = []
+    for description in descs:
+        field = description.ufp_required_field
+        if field and not data.async_has_capability(ufp_device, field):
+            continue
+        assert isinstance(description, EntityDescription)
+        if platform is not None and data.async_is_entity_disabled(
+            platform, f"{ufp_device.id}_{description.key}"
+        ):
+            continue
+
+        entities.append(klass(data, device=ufp_device, description=description))
+
+    return entities
 
 
 class ProtectDeviceEntity(Entity):
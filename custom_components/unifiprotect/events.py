@@ -0,0 +1,114 @@
+"""UniFi Protect Integration bus events."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from pyunifiprotect.data import Event, EventType, Sensor, WSSubscriptionMessage
+from pyunifiprotect.data.websocket import WSAction
+
+from .const import ATTR_EVENT_SCORE, ATTR_TIMESTAMP
+
+ATTR_TYPE = "type"
+ATTR_PROTECT_ID = "protect_id"
+ATTR_EVENT_ID = "event_id"
+ATTR_SMART_DETECT_TYPES = "smart_detect_types"
+
+PROTECT_EVENT_RING = "ring"
+PROTECT_EVENT_MOTION_START = "motion_start"
+PROTECT_EVENT_MOTION_END = "motion_end"
+PROTECT_EVENT_SMART_DETECT = "smart_detect"
+PROTECT_EVENT_SENSOR_OPEN = "sensor_open"
+PROTECT_EVENT_SENSOR_CLOSE = "sensor_close"
+PROTECT_EVENT_SENSOR_TAMPER = "sensor_tamper"
+
+ADD_EVENT_TYPES = {
+    EventType.RING: PROTECT_EVENT_RING,
+    EventType.MOTION: PROTECT_EVENT_MOTION_START,
+    EventType.SENSOR_OPENED: PROTECT_EVENT_SENSOR_OPEN,
+    EventType.SENSOR_CLOSED: PROTECT_EVENT_SENSOR_CLOSE,
+}
+
+
+@callback
+def _async_event_device_id(event: Event) -> str | None:
+    for device in (event.camera, event.light, event.sensor):
+        if device is not None:
+            return device.id
+    return None
+
+
+@callback
+def _async_event_payload(
+    event_type: str, event: Event, **extra: Any
+) -> dict[str, Any] | None:
+    if (device_id := _async_event_device_id(event)) is None:
+        return None
+
+    return {
+        ATTR_TYPE: event_type,
+        ATTR_PROTECT_ID: device_id,
+        ATTR_EVENT_ID: event.id,
+        ATTR_TIMESTAMP: (event.end or event.start).isoformat(),
+        **extra,
+    }
+
+
+@callback
+def async_build_event_payload(message: WSSubscriptionMessage) -> dict[str, Any] | None:
+    """Build the bus event payload for a websocket message, if it has one."""
+    obj = message.new_obj
+
+    if isinstance(obj, Sensor):
+        if (
+            "tampering_detected_at" in message.changed_data
+            and obj.tampering_detected_at is not None
+        ):
+            return {
+                ATTR_TYPE: PROTECT_EVENT_SENSOR_TAMPER,
+                ATTR_PROTECT_ID: obj.id,
+                ATTR_TIMESTAMP: obj.tampering_detected_at.isoformat(),
+            }
+        return None
+
+    if not isinstance(obj, Event):
+        return None
+
+    if message.action == WSAction.ADD:
+        if event_type := ADD_EVENT_TYPES.get(obj.type):
+            return _async_event_payload(event_type, obj)
+        if obj.type == EventType.SMART_DETECT and obj.smart_detect_types:
+            return _async_event_payload(
+                PROTECT_EVENT_SMART_DETECT,
+                obj,
+                **{
+                    ATTR_EVENT_SCORE: obj.score,
+                    ATTR_SMART_DETECT_TYPES: [t.value for t in obj.smart_detect_types],
+                },
+            )
+        return None
+
+    if (
+        obj.type == EventType.MOTION
+        and obj.end is not None
+        and "end" in message.changed_data
+    ):
+        return _async_event_payload(
+            PROTECT_EVENT_MOTION_END, obj, **{ATTR_EVENT_SCORE: obj.score}
+        )
+
+    # smart detect types can be added to an event while it is ongoing
+    if obj.type == EventType.SMART_DETECT and isinstance(message.old_obj, Event):
+        new_types = set(obj.smart_detect_types) - set(
+            message.old_obj.smart_detect_types
+        )
+        if new_types:
+            return _async_event_payload(
+                PROTECT_EVENT_SMART_DETECT,
+                obj,
+                **{
+                    ATTR_EVENT_SCORE: obj.score,
+                    ATTR_SMART_DETECT_TYPES: [t.value for t in new_types],
+                },
+            )
+    return None
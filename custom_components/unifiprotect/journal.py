@@ -0,0 +1,241 @@
+"""Local event journal for UniFi Protect Integration."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+import sqlite3
+import threading
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.util.dt import utc_from_timestamp, utcnow
+from pyunifiprotect.data import Event
+
+_LOGGER = logging.getLogger(__name__)
+
+JOURNAL_BATCH_SIZE = 100
+JOURNAL_FLUSH_DELAY = 5
+JOURNAL_PURGE_INTERVAL = timedelta(hours=1)
+JOURNAL_MAX_LIMIT = 500
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS events (
+        id TEXT PRIMARY KEY,
+        type TEXT NOT NULL,
+        device_id TEXT,
+        start REAL NOT NULL,
+        end REAL,
+        score INTEGER,
+        smart_detect_types TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_events_device_start ON events (device_id, start)",
+    "CREATE INDEX IF NOT EXISTS idx_events_type_start ON events (type, start)",
+    "CREATE INDEX IF NOT EXISTS idx_events_start ON events (start)",
+)
+_UPSERT = "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?)"
+_COLUMNS = ("id", "type", "device_id", "start", "end", "score", "smart_detect_types")
+
+EventRow = tuple[Any, ...]
+
+
+def _event_to_row(event: Event) -> EventRow:
+    device_id: str | None = None
+    for device in (event.camera, event.light, event.sensor):
+        if device is not None:
+            device_id = device.id
+            break
+
+    return (
+        event.id,
+        event.type.value,
+        device_id,
+        event.start.timestamp(),
+        None if event.end is None else event.end.timestamp(),
+        event.score,
+        ",".join(t.value for t in event.smart_detect_types),
+    )
+
+
+def encode_cursor(row: dict[str, Any]) -> str:
+    """Encode the position of a row for keyset pagination."""
+    return f"{row['start']}:{row['id']}"
+
+
+def decode_cursor(cursor: str) -> tuple[float, str]:
+    """Decode a pagination cursor."""
+    start, _, event_id = cursor.partition(":")
+    return float(start), event_id
+
+
+class ProtectEventJournal:
+    """Append only SQLite journal of UniFi Protect events.
+
+    Events are buffered in memory and written in batches from the executor.
+    Rows are keyed by event ID so later updates to an ongoing event (end time,
+    smart detect types) replace the earlier row.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str, retention: timedelta) -> None:
+        """Init the journal."""
+        self._hass = hass
+        self._path = path
+        self.retention = retention
+        self._pending: dict[str, EventRow] = {}
+        self._lock = threading.Lock()
+        # flushes write in the order their rows were queued
+        self._flush_lock = asyncio.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self._unsub_purge: CALLBACK_TYPE | None = None
+
+    def _setup(self) -> None:
+        conn = sqlite3.connect(self._path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        conn.commit()
+        self._conn = conn
+
+    def _write(self, rows: list[EventRow]) -> None:
+        with self._lock:
+            assert self._conn is not None
+            self._conn.executemany(_UPSERT, rows)
+            self._conn.commit()
+
+    def _purge(self, before: float) -> int:
+        with self._lock:
+            # the journal may be closed before a background purge runs
+            if self._conn is None:
+                return 0
+            cursor = self._conn.execute("DELETE FROM events WHERE start < ?", (before,))
+            self._conn.commit()
+            return cursor.rowcount
+
+    def _query(self, sql: str, params: list[Any]) -> list[dict[str, Any]]:
+        with self._lock:
+            assert self._conn is not None
+            return [
+                dict(zip(_COLUMNS, row))
+                for row in self._conn.execute(sql, params).fetchall()
+            ]
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def async_setup(self) -> None:
+        """Open the journal and start the retention purge."""
+        await self._hass.async_add_executor_job(self._setup)
+        self._unsub_purge = async_track_time_interval(
+            self._hass, self._async_purge, JOURNAL_PURGE_INTERVAL
+        )
+        # do not hold up the entry setup while old events are purged
+        self._hass.async_create_task(self._async_purge())
+
+    async def async_stop(self) -> None:
+        """Write out pending events and close the journal."""
+        if self._unsub_purge is not None:
+            self._unsub_purge()
+            self._unsub_purge = None
+        if self._conn is None:
+            return
+        await self.async_flush()
+        await self._hass.async_add_executor_job(self._close)
+
+    @callback
+    def async_add_event(self, event: Event) -> None:
+        """Queue an event to be written."""
+        if self._conn is None:
+            return
+
+        self._pending[event.id] = _event_to_row(event)
+        if len(self._pending) >= JOURNAL_BATCH_SIZE:
+            self._hass.async_create_task(self.async_flush())
+        elif self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self._hass, JOURNAL_FLUSH_DELAY, self.async_flush
+            )
+
+    async def async_flush(self, *_: Any) -> None:
+        """Write all pending events."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        async with self._flush_lock:
+            if not self._pending or self._conn is None:
+                return
+
+            rows = list(self._pending.values())
+            self._pending = {}
+            await self._hass.async_add_executor_job(self._write, rows)
+
+    async def _async_purge(self, *_: Any) -> None:
+        before = (utcnow() - self.retention).timestamp()
+        count = await self._hass.async_add_executor_job(self._purge, before)
+        if count:
+            _LOGGER.debug("Purged %s events from event journal", count)
+
+    async def async_get_since(self, start: datetime) -> list[dict[str, Any]]:
+        """Get all device events since start, as stored."""
+        await self.async_flush()
+        return await self._hass.async_add_executor_job(
+            self._query,
+            "SELECT * FROM events WHERE start >= ? AND device_id IS NOT NULL",
+            [start.timestamp()],
+        )
+
+    async def async_query(
+        self,
+        device_id: str | None = None,
+        event_type: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Query events, newest first."""
+        # make sure recent events are visible to the query
+        await self.async_flush()
+
+        clauses: list[str] = []
+        params: list[Any] = []
+        if device_id is not None:
+            clauses.append("device_id = ?")
+            params.append(device_id)
+        if event_type is not None:
+            clauses.append("type = ?")
+            params.append(event_type)
+        if start is not None:
+            clauses.append("start >= ?")
+            params.append(start.timestamp())
+        if end is not None:
+            clauses.append("start < ?")
+            params.append(end.timestamp())
+        if cursor is not None:
+            cursor_start, cursor_id = decode_cursor(cursor)
+            clauses.append("(start < ? OR (start = ? AND id < ?))")
+            params.extend((cursor_start, cursor_start, cursor_id))
+
+        sql = "SELECT * FROM events"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY start DESC, id DESC LIMIT ?"
+        params.append(min(limit, JOURNAL_MAX_LIMIT))
+
+        rows = await self._hass.async_add_executor_job(self._query, sql, params)
+        for row in rows:
+            row["cursor"] = encode_cursor(row)
+            row["start"] = utc_from_timestamp(row["start"]).isoformat()
+            if row["end"] is not None:
+                row["end"] = utc_from_timestamp(row["end"]).isoformat()
+            row["smart_detect_types"] = [
+                t for t in row["smart_detect_types"].split(",") if t
+            ]
+        return rows
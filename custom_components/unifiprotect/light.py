@@ -10,17 +10,22 @@ from homeassistant.components.light import (
     LightEntity,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pyunifiprotect.data import Light
+from pyunifiprotect.data.base import ProtectAdoptableDeviceModel, ProtectDeviceModel
 
 from .const import DOMAIN
 from .data import ProtectData
 from .entity import ProtectDeviceEntity
+from .profiler import profile_platform
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@profile_platform(Platform.LIGHT)
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -28,18 +33,28 @@ async def async_setup_entry(
 ) -> None:
     """Set up lights for UniFi Protect integration."""
     data: ProtectData = hass.data[DOMAIN][entry.entry_id]
-    entities = [
-        ProtectLight(
-            data,
-            device,
-        )
-        for device in data.api.bootstrap.lights.values()
-    ]
-
-    if not entities:
-        return
 
-    async_add_entities(entities)
+    @callback
+    def _add_new_device(device: ProtectAdoptableDeviceModel) -> None:
+        async_add_entities(async_device_entities(data, device))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, data.adopt_signal, _add_new_device)
+    )
+
+    async_add_entities(data.async_pop_entities(Platform.LIGHT, async_device_entities))
+
+
+@callback
+def async_device_entities(
+    data: ProtectData, device: ProtectDeviceModel
+) -> list[ProtectDeviceEntity]:
+    """Build the light of a device."""
+    if not isinstance(device, Light) or data.async_is_entity_disabled(
+        Platform.LIGHT, device.id
+    ):
+        return []
+    return [ProtectLight(data, device)]
 
 
 def unifi_brightness_to_hass(value: int) -> int:
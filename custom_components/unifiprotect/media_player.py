@@ -17,20 +17,24 @@ from homeassistant.components.media_player.const import (
     SUPPORT_VOLUME_STEP,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_IDLE, STATE_PLAYING
+from homeassistant.const import STATE_IDLE, STATE_PLAYING, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pyunifiprotect.data import Camera
+from pyunifiprotect.data.base import ProtectAdoptableDeviceModel, ProtectDeviceModel
 from pyunifiprotect.exceptions import StreamError
 
 from .const import DOMAIN
 from .data import ProtectData
 from .entity import ProtectDeviceEntity
+from .profiler import profile_platform
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@profile_platform(Platform.MEDIA_PLAYER)
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -39,18 +43,33 @@ async def async_setup_entry(
     """Discover cameras with speakers on a UniFi Protect NVR."""
     data: ProtectData = hass.data[DOMAIN][entry.entry_id]
 
+    @callback
+    def _add_new_device(device: ProtectAdoptableDeviceModel) -> None:
+        async_add_entities(async_device_entities(data, device))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, data.adopt_signal, _add_new_device)
+    )
+
     async_add_entities(
-        [
-            ProtectMediaPlayer(
-                data,
-                camera,
-            )
-            for camera in data.api.bootstrap.cameras.values()
-            if camera.feature_flags.has_speaker
-        ]
+        data.async_pop_entities(Platform.MEDIA_PLAYER, async_device_entities)
     )
 
 
+@callback
+def async_device_entities(
+    data: ProtectData, device: ProtectDeviceModel
+) -> list[ProtectDeviceEntity]:
+    """Build the speaker of a device."""
+    if (
+        not isinstance(device, Camera)
+        or not device.feature_flags.has_speaker
+        or data.async_is_entity_disabled(Platform.MEDIA_PLAYER, f"{device.id}_speaker")
+    ):
+        return []
+    return [ProtectMediaPlayer(data, device)]
+
+
 class ProtectMediaPlayer(ProtectDeviceEntity, MediaPlayerEntity):
     """A Ubiquiti UniFi Protect Speaker."""
 
@@ -0,0 +1,275 @@
+"""UniFi Protect media source, browsing recorded events per camera and day."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.components.media_player.const import (
+    MEDIA_CLASS_DIRECTORY,
+    MEDIA_CLASS_VIDEO,
+)
+from homeassistant.components.media_source.error import Unresolvable
+from homeassistant.components.media_source.models import (
+    BrowseMediaSource,
+    MediaSource,
+    MediaSourceItem,
+    PlayMedia,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from pyunifiprotect.data import Camera, EventType
+from pyunifiprotect.exceptions import NvrError
+
+from .const import DOMAIN
+from .data import ProtectData
+from .views import async_generate_thumbnail_url, async_generate_video_url
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_DAYS = 30
+PAGE_SIZE = 50
+EVENT_TYPES = (EventType.MOTION, EventType.SMART_DETECT, EventType.RING)
+EVENT_TITLES = {
+    EventType.MOTION.value: "Motion",
+    EventType.SMART_DETECT.value: "Smart Detection",
+    EventType.RING.value: "Ring",
+}
+MIME_TYPE = "video/mp4"
+SEPARATOR = ":"
+EVENT_KEY = "event"
+
+
+async def async_get_media_source(hass: HomeAssistant) -> MediaSource:
+    """Set up UniFi Protect media source."""
+    return ProtectMediaSource(hass)
+
+
+def _to_ms(value: datetime) -> int:
+    return int(value.timestamp() * 1000)
+
+
+def _from_ms(value: int) -> datetime:
+    return dt_util.utc_from_timestamp(value / 1000)
+
+
+class ProtectMediaSource(MediaSource):
+    """Browse UniFi Protect recordings.
+
+    Identifiers are built from the most to least specific part and separated
+    by ``:``::
+
+        <entry_id>
+        <entry_id>:<camera_id>
+        <entry_id>:<camera_id>:<YYYY-MM-DD>[:<start>:<event_id>]
+        <entry_id>:<camera_id>:event:<event_id>:<start>:<end>
+
+    Nothing is listed until it is expanded and days are loaded one page at a
+    time, so browsing never pulls more than ``PAGE_SIZE`` events from the NVR.
+    """
+
+    name = "UniFi Protect"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize UniFi Protect media source."""
+        super().__init__(DOMAIN)
+        self.hass = hass
+
+    @callback
+    def _get_data(self, entry_id: str) -> ProtectData:
+        data = self.hass.data.get(DOMAIN, {}).get(entry_id)
+        if not isinstance(data, ProtectData):
+            raise Unresolvable(f"Unknown UniFi Protect NVR: {entry_id}")
+        return data
+
+    @callback
+    def _get_camera(self, data: ProtectData, camera_id: str) -> Camera:
+        camera = data.api.bootstrap.cameras.get(camera_id)
+        if camera is None:
+            raise Unresolvable(f"Unknown UniFi Protect camera: {camera_id}")
+        return camera
+
+    async def async_resolve_media(self, item: MediaSourceItem) -> PlayMedia:
+        """Resolve an event to a streamable URL."""
+        parts = (item.identifier or "").split(SEPARATOR)
+        if len(parts) != 6 or parts[2] != EVENT_KEY:
+            raise Unresolvable(f"Not a UniFi Protect event: {item.identifier}")
+
+        entry_id, camera_id, _, _, start, end = parts
+        self._get_camera(self._get_data(entry_id), camera_id)
+        url = async_generate_video_url(
+            entry_id, camera_id, _from_ms(int(start)), _from_ms(int(end))
+        )
+        return PlayMedia(url, MIME_TYPE)
+
+    async def async_browse_media(self, item: MediaSourceItem) -> BrowseMediaSource:
+        """Return one level of the media tree."""
+        if not item.identifier:
+            return self._browse_root()
+
+        parts = item.identifier.split(SEPARATOR)
+        data = self._get_data(parts[0])
+        if len(parts) == 1:
+            return self._browse_nvr(data)
+
+        camera = self._get_camera(data, parts[1])
+        if len(parts) == 2:
+            return self._browse_camera(data, camera)
+        if parts[2] == EVENT_KEY:
+            raise Unresolvable("Events cannot be expanded")
+
+        cursor: tuple[int, str] | None = None
+        if len(parts) == 5:
+            cursor = (int(parts[3]), parts[4])
+        elif len(parts) != 3:
+            raise Unresolvable(f"Invalid identifier: {item.identifier}")
+        return await self._browse_day(data, camera, parts[2], cursor)
+
+    @callback
+    def _directory(
+        self, identifier: str | None, title: str, children: list[BrowseMediaSource]
+    ) -> BrowseMediaSource:
+        return BrowseMediaSource(
+            domain=DOMAIN,
+            identifier=identifier,
+            media_class=MEDIA_CLASS_DIRECTORY,
+            media_content_type=MIME_TYPE,
+            title=title,
+            can_play=False,
+            can_expand=True,
+            children=children,
+        )
+
+    @callback
+    def _browse_root(self) -> BrowseMediaSource:
+        children = [
+            self._directory(entry_id, data.api.bootstrap.nvr.name, [])
+            for entry_id, data in self.hass.data.get(DOMAIN, {}).items()
+            if isinstance(data, ProtectData)
+        ]
+        return self._directory(None, self.name, children)
+
+    @callback
+    def _browse_nvr(self, data: ProtectData) -> BrowseMediaSource:
+        entry_id = data.entry_id
+        children = [
+            self._directory(f"{entry_id}{SEPARATOR}{camera.id}", camera.name, [])
+            for camera in data.api.bootstrap.cameras.values()
+        ]
+        return self._directory(entry_id, data.api.bootstrap.nvr.name, children)
+
+    @callback
+    def _browse_camera(self, data: ProtectData, camera: Camera) -> BrowseMediaSource:
+        base = SEPARATOR.join((data.entry_id, camera.id))
+        today = dt_util.start_of_local_day()
+        first = today - timedelta(days=MAX_DAYS - 1)
+        recording_start = camera.stats.video.recording_start
+        if recording_start is not None:
+            first = max(first, dt_util.start_of_local_day(recording_start))
+
+        children = []
+        day = today
+        while day >= first:
+            title = day.strftime("%Y-%m-%d")
+            children.append(self._directory(f"{base}{SEPARATOR}{title}", title, []))
+            day = dt_util.start_of_local_day(day - timedelta(hours=12))
+        return self._directory(base, camera.name, children)
+
+    async def _browse_day(
+        self,
+        data: ProtectData,
+        camera: Camera,
+        day: str,
+        cursor: tuple[int, str] | None,
+    ) -> BrowseMediaSource:
+        base = SEPARATOR.join((data.entry_id, camera.id, day))
+        date = dt_util.parse_date(day)
+        if date is None:
+            raise Unresolvable(f"Invalid day: {day}")
+
+        start = dt_util.start_of_local_day(date)
+        end = dt_util.start_of_local_day(start + timedelta(hours=36))
+        if cursor is not None:
+            # events sharing the start of the cursor may not all be listed yet
+            end = min(end, _from_ms(cursor[0] + 1))
+
+        # newest first, ``end`` is moved back one page at a time
+        params: list[tuple[str, Any]] = [
+            ("cameras", camera.id),
+            ("start", _to_ms(start)),
+            ("end", _to_ms(end)),
+            ("limit", PAGE_SIZE),
+            ("orderDirection", "DESC"),
+        ]
+        params.extend(("types", event_type.value) for event_type in EVENT_TYPES)
+        try:
+            events = await data.api.api_request_list("events", params=params)
+        except NvrError as err:
+            raise Unresolvable(f"Could not list events: {err}") from err
+
+        # (start, id) orders events that start in the same millisecond
+        events.sort(key=lambda event: (event["start"], event["id"]), reverse=True)
+        has_more = len(events) >= PAGE_SIZE
+        if has_more and events[0]["start"] != events[-1]["start"]:
+            # the events sharing the oldest start may continue past the page
+            oldest = events[-1]["start"]
+            events = [event for event in events if event["start"] != oldest]
+
+        children = []
+        next_cursor: tuple[int, str] | None = None
+        for event in events:
+            if cursor is not None and (event["start"], event["id"]) >= cursor:
+                continue
+            next_cursor = (event["start"], event["id"])
+            # ongoing events have no full recording yet, they are listed once
+            # they have ended and the day is browsed again
+            if event["end"] is None:
+                continue
+            children.append(self._event(data, camera, event))
+
+        if has_more and next_cursor is not None:
+            children.append(
+                self._directory(
+                    SEPARATOR.join((base, str(next_cursor[0]), next_cursor[1])),
+                    "Older events",
+                    [],
+                )
+            )
+
+        title = f"{camera.name} {day}"
+        identifier = base
+        if cursor is not None:
+            identifier = SEPARATOR.join((base, str(cursor[0]), cursor[1]))
+        return self._directory(identifier, title, children)
+
+    @callback
+    def _event(
+        self, data: ProtectData, camera: Camera, event: dict[str, Any]
+    ) -> BrowseMediaSource:
+        entry_id = data.entry_id
+        start = _from_ms(event["start"])
+        title = EVENT_TITLES.get(event["type"], event["type"])
+        if smart_types := event.get("smartDetectTypes"):
+            title = f"{title} ({', '.join(smart_types)})"
+        time = dt_util.as_local(start).strftime("%H:%M:%S")
+
+        identifier = SEPARATOR.join(
+            (
+                entry_id,
+                camera.id,
+                EVENT_KEY,
+                event["id"],
+                str(event["start"]),
+                str(event["end"]),
+            )
+        )
+        return BrowseMediaSource(
+            domain=DOMAIN,
+            identifier=identifier,
+            media_class=MEDIA_CLASS_VIDEO,
+            media_content_type=MIME_TYPE,
+            title=f"{time} {title}",
+            can_play=True,
+            can_expand=False,
+            thumbnail=async_generate_thumbnail_url(entry_id, event["id"]),
+        )
@@ -7,15 +7,19 @@ from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from pyunifiprotect.data.base import ProtectAdoptableDeviceModel, ProtectDeviceModel
 from pyunifiprotect.data.devices import Camera, Light
 
 from .const import DOMAIN
 from .data import ProtectData
 from .entity import ProtectDeviceEntity, async_all_device_entities
 from .models import ProtectSetableKeysMixin
+from .profiler import profile_platform
 
 
 @dataclass
@@ -126,6 +130,7 @@ SENSE_NUMBERS: tuple[ProtectNumberEntityDescription, ...] = (
 )
 
 
+@profile_platform(Platform.NUMBER)
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -133,16 +138,33 @@ async def async_setup_entry(
 ) -> None:
     """Set up number entities for UniFi Protect integration."""
     data: ProtectData = hass.data[DOMAIN][entry.entry_id]
-    entities: list[ProtectDeviceEntity] = async_all_device_entities(
+
+    @callback
+    def _add_new_device(device: ProtectAdoptableDeviceModel) -> None:
+        async_add_entities(async_device_entities(data, device))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, data.adopt_signal, _add_new_device)
+    )
+
+    async_add_entities(data.async_pop_entities(Platform.NUMBER, async_device_entities))
+
+
+@callback
+def async_device_entities(
+    data: ProtectData, device: ProtectDeviceModel
+) -> list[ProtectDeviceEntity]:
+    """Build the number entities of a device."""
+    return async_all_device_entities(
         data,
         ProtectNumbers,
         camera_descs=CAMERA_NUMBERS,
         light_descs=LIGHT_NUMBERS,
         sense_descs=SENSE_NUMBERS,
+        platform=Platform.NUMBER,
+        ufp_device=device,
     )
 
-    async_add_entities(entities)
-
 
 class ProtectNumbers(ProtectDeviceEntity, NumberEntity):
     """A UniFi Protect Number Entity."""
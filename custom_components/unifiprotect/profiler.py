@@ -0,0 +1,180 @@
+"""Startup profiler for UniFi Protect Integration."""
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Awaitable, Callable, Generator, Iterable
+from contextlib import contextmanager
+import functools
+import json
+import logging
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SetupEntry = Callable[
+    [HomeAssistant, ConfigEntry, AddEntitiesCallback], Awaitable[None]
+]
+
+
+class StartupProfiler:
+    """Record how long each phase of setting up a config entry takes.
+
+    Wall time is always recorded and logged at debug level. When enabled, the
+    peak memory allocated during each phase is traced as well and the full
+    profile is logged as a single JSON line and kept for diagnostics. Memory is
+    traced process wide, so other integrations starting at the same time are
+    included in the peaks. Platforms are set up concurrently, so they share a
+    single ``platforms`` peak instead of one each.
+    """
+
+    def __init__(self, title: str, enabled: bool = False) -> None:
+        """Init the profiler."""
+        self.title = title
+        self.enabled = enabled
+        self.phases: dict[str, dict[str, float]] = {}
+        self.entities: dict[str, Counter[str]] = {}
+        self._pending: set[str] = set()
+        self._started = time.monotonic()
+        self._total: float | None = None
+        self._owns_tracing = False
+        self._platforms_started: float | None = None
+        self._platforms_baseline = 0
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+
+    @contextmanager
+    def phase(
+        self, name: str, trace_memory: bool = True
+    ) -> Generator[None, None, None]:
+        """Measure a phase."""
+        tracing = trace_memory and self.enabled and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            result = {"wall_ms": round((time.monotonic() - started) * 1000, 1)}
+            if tracing:
+                peak = tracemalloc.get_traced_memory()[1] - baseline
+                result["peak_kib"] = round(max(peak, 0) / 1024, 1)
+            self.phases[name] = result
+
+    @contextmanager
+    def platform_phase(self, platform: str) -> Generator[None, None, None]:
+        """Measure the setup of a platform, memory is traced for all of them."""
+        if platform in self._pending and self._platforms_started is None:
+            self._platforms_started = time.monotonic()
+            if self.enabled and tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+                self._platforms_baseline = tracemalloc.get_traced_memory()[0]
+        with self.phase(f"platform.{platform}", trace_memory=False):
+            yield
+
+    @callback
+    def async_expect_platforms(self, platforms: Iterable[str]) -> None:
+        """Set the platforms the profile waits for before it is reported."""
+        self._pending.update(platforms)
+        if not self._pending:
+            self._async_report()
+
+    @callback
+    def async_add_entities(self, platform: str, entities: Iterable[Entity]) -> None:
+        """Count entities built for a platform by class."""
+        counts = self.entities.setdefault(platform, Counter())
+        counts.update(type(entity).__name__ for entity in entities)
+
+    @callback
+    def async_platform_done(self, platform: str) -> None:
+        """Mark a platform as set up."""
+        if platform not in self._pending:
+            return
+
+        self._pending.discard(platform)
+        if not self._pending:
+            self._async_report()
+
+    @property
+    def report(self) -> dict[str, Any]:
+        """Return the profile."""
+        return {
+            "entry": self.title,
+            "total_ms": self._total,
+            "phases": self.phases,
+            "entities": {
+                platform: dict(counts) for platform, counts in self.entities.items()
+            },
+        }
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracing memory if the profiler started it."""
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    @callback
+    def _async_report(self) -> None:
+        now = time.monotonic()
+        self._total = round((now - self._started) * 1000, 1)
+        if self._platforms_started is not None:
+            result = {"wall_ms": round((now - self._platforms_started) * 1000, 1)}
+            if self.enabled and tracemalloc.is_tracing():
+                peak = tracemalloc.get_traced_memory()[1] - self._platforms_baseline
+                result["peak_kib"] = round(max(peak, 0) / 1024, 1)
+            self.phases["platforms"] = result
+        self.async_stop()
+
+        if self.enabled:
+            _LOGGER.info("Startup profile: %s", json.dumps(self.report))
+        else:
+            _LOGGER.debug(
+                "Startup timings for %s: %s",
+                self.title,
+                ", ".join(
+                    f"{name}={result['wall_ms']}ms"
+                    for name, result in self.phases.items()
+                ),
+            )
+
+
+def profile_platform(platform: str) -> Callable[[SetupEntry], SetupEntry]:
+    """Profile the async_setup_entry of a platform."""
+
+    def _decorator(func: SetupEntry) -> SetupEntry:
+        @functools.wraps(func)
+        async def _async_setup_entry(
+            hass: HomeAssistant,
+            entry: ConfigEntry,
+            async_add_entities: AddEntitiesCallback,
+        ) -> None:
+            profiler: StartupProfiler = hass.data[DOMAIN][entry.entry_id].profiler
+
+            @callback
+            def _async_add_entities(
+                new_entities: Iterable[Entity], update_before_add: bool = False
+            ) -> None:
+                new_entities = list(new_entities)
+                profiler.async_add_entities(platform, new_entities)
+                async_add_entities(new_entities, update_before_add)
+
+            try:
+                with profiler.platform_phase(platform):
+                    await func(hass, entry, _async_add_entities)
+            finally:
+                profiler.async_platform_done(platform)
+
+        return _async_setup_entry
+
+    return _decorator
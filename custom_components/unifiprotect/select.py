@@ -10,10 +10,11 @@ from typing import Any, Final
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.const import ATTR_ENTITY_ID, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, entity_platform
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.util.dt import utcnow
 from pyunifiprotect.api import ProtectApiClient
@@ -27,16 +28,23 @@ from pyunifiprotect.data import (
     RecordingMode,
     Viewer,
 )
-from pyunifiprotect.data.base import ProtectAdoptableDeviceModel
+from pyunifiprotect.data.base import ProtectAdoptableDeviceModel, ProtectDeviceModel
 from pyunifiprotect.data.devices import Sensor
 from pyunifiprotect.data.nvr import NVR
 from pyunifiprotect.data.types import ChimeType, MountType
 import voluptuous as vol
 
-from .const import ATTR_DURATION, ATTR_MESSAGE, DOMAIN, TYPE_EMPTY_VALUE
+from .const import (
+    ATTR_DURATION,
+    ATTR_MESSAGE,
+    DOMAIN,
+    SIGNAL_LIVEVIEWS,
+    TYPE_EMPTY_VALUE,
+)
 from .data import ProtectData
 from .entity import ProtectDeviceEntity, async_all_device_entities
 from .models import ProtectSetableKeysMixin
+from .profiler import profile_platform
 
 _LOGGER = logging.getLogger(__name__)
 _KEY_LIGHT_MOTION = "light_motion"
@@ -300,6 +308,7 @@ VIEWER_SELECTS: tuple[ProtectSelectEntityDescription, ...] = (
 )
 
 
+@profile_platform(Platform.SELECT)
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -307,16 +316,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up number entities for UniFi Protect integration."""
     data: ProtectData = hass.data[DOMAIN][entry.entry_id]
-    entities: list[ProtectDeviceEntity] = async_all_device_entities(
-        data,
-        ProtectSelects,
-        camera_descs=CAMERA_SELECTS,
-        light_descs=LIGHT_SELECTS,
-        sense_descs=SENSE_SELECTS,
-        viewer_descs=VIEWER_SELECTS,
+
+    @callback
+    def _add_new_device(device: ProtectAdoptableDeviceModel) -> None:
+        async_add_entities(async_device_entities(data, device))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, data.adopt_signal, _add_new_device)
     )
 
-    async_add_entities(entities)
+    async_add_entities(data.async_pop_entities(Platform.SELECT, async_device_entities))
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
         SERVICE_SET_DOORBELL_MESSAGE,
@@ -325,6 +334,23 @@ async def async_setup_entry(
     )
 
 
+@callback
+def async_device_entities(
+    data: ProtectData, device: ProtectDeviceModel
+) -> list[ProtectDeviceEntity]:
+    """Build the selects of a device."""
+    return async_all_device_entities(
+        data,
+        ProtectSelects,
+        camera_descs=CAMERA_SELECTS,
+        light_descs=LIGHT_SELECTS,
+        sense_descs=SENSE_SELECTS,
+        viewer_descs=VIEWER_SELECTS,
+        platform=Platform.SELECT,
+        ufp_device=device,
+    )
+
+
 class ProtectSelects(ProtectDeviceEntity, SelectEntity):
     """A UniFi Protect Select Entity."""
 
@@ -342,6 +368,22 @@ class ProtectSelects(ProtectDeviceEntity, SelectEntity):
         self._attr_name = f"{self.device.name} {self.entity_description.name}"
         self._async_set_options()
 
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        # Liveview options only change with the liveviews, not with the Viewport
+        if self.entity_description.ufp_options_callable is _get_viewer_options:
+            self.async_on_remove(
+                self.data.async_subscribe_device_id(
+                    SIGNAL_LIVEVIEWS, self._async_updated_options
+                )
+            )
+
+    @callback
+    def _async_updated_options(self) -> None:
+        self._async_set_options()
+        self.async_write_ha_state()
+
     @callback
     def _async_update_device_from_protect(self) -> None:
         super()._async_update_device_from_protect()
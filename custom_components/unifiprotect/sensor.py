@@ -1,6 +1,7 @@
 """This component provides sensors for UniFi Protect."""
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 import logging
@@ -22,16 +23,26 @@ from homeassistant.const import (
     PERCENTAGE,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
     TEMP_CELSIUS,
+    TIME_DAYS,
+    TIME_MILLISECONDS,
     TIME_SECONDS,
+    Platform,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pyunifiprotect.data import NVR, Camera, Event
-from pyunifiprotect.data.base import ProtectAdoptableDeviceModel
+from pyunifiprotect.data.base import ProtectAdoptableDeviceModel, ProtectDeviceModel
 from pyunifiprotect.data.devices import Sensor
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    SIGNAL_AGGREGATES,
+    SIGNAL_DETECTIONS,
+    SIGNAL_DIAGNOSTICS,
+    SIGNAL_OPTIONS,
+)
 from .data import ProtectData
 from .entity import (
     EventThumbnailMixin,
@@ -40,6 +51,16 @@ from .entity import (
     async_all_device_entities,
 )
 from .models import ProtectRequiredKeysMixin
+from .profiler import profile_platform
+from .stats import (
+    DETECTION_MOTION,
+    DETECTION_PERSON,
+    DETECTION_RING,
+    DETECTION_VEHICLE,
+    DETECTION_WINDOWS,
+    ProtectAggregates,
+)
+from .utils import ByteRateSampler
 
 _LOGGER = logging.getLogger(__name__)
 OBJECT_TYPE_NONE = "none"
@@ -61,6 +82,14 @@ class ProtectSensorEntityDescription(ProtectRequiredKeysMixin, SensorEntityDescr
         return value
 
 
+@dataclass
+class ProtectDetectionSensorEntityDescription(ProtectSensorEntityDescription):
+    """Describes UniFi Protect rolling detection count Sensor entity."""
+
+    detection_type: str = DETECTION_MOTION
+    detection_window: str = "1h"
+
+
 def _get_uptime(obj: ProtectAdoptableDeviceModel | NVR) -> datetime | None:
     if obj.up_since is None:
         return None
@@ -88,6 +117,19 @@ def _get_nvr_memory(obj: Any) -> float | None:
     return (1 - memory.available / memory.total) * 100
 
 
+def _get_aggregate_ingest_rate(obj: Any) -> float:
+    assert isinstance(obj, ProtectAggregates)
+
+    # bits per second to megabits per second
+    return max(obj.ingest_rate, 0) / 1_000_000
+
+
+def _get_aggregate_write_rate(obj: Any) -> float:
+    assert isinstance(obj, ProtectAggregates)
+
+    return max(obj.write_rate, 0)
+
+
 def _get_alarm_sound(obj: ProtectAdoptableDeviceModel | NVR) -> str:
     assert isinstance(obj, Sensor)
 
@@ -206,6 +248,54 @@ CAMERA_DISABLED_SENSORS: tuple[ProtectSensorEntityDescription, ...] = (
     ),
 )
 
+CAMERA_RATE_SENSORS: tuple[ProtectSensorEntityDescription, ...] = (
+    ProtectSensorEntityDescription(
+        key="stats_rx_rate",
+        name="Received Data Rate",
+        native_unit_of_measurement=DATA_RATE_MEGABITS_PER_SECOND,
+        icon="mdi:download-network",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="stats.rx_bytes",
+        precision=3,
+    ),
+    ProtectSensorEntityDescription(
+        key="stats_tx_rate",
+        name="Transferred Data Rate",
+        native_unit_of_measurement=DATA_RATE_MEGABITS_PER_SECOND,
+        icon="mdi:upload-network",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="stats.tx_bytes",
+        precision=3,
+    ),
+)
+
+# detection type: (name, icon, required feature)
+_DETECTION_SENSOR_TYPES: dict[str, tuple[str, str, str | None]] = {
+    DETECTION_MOTION: ("Motion", "mdi:run-fast", None),
+    DETECTION_RING: ("Ring", "mdi:doorbell-video", "feature_flags.has_chime"),
+    DETECTION_PERSON: ("Person", "mdi:walk", "feature_flags.has_smart_detect"),
+    DETECTION_VEHICLE: ("Vehicle", "mdi:car", "feature_flags.has_smart_detect"),
+}
+
+CAMERA_DETECTION_SENSORS: tuple[ProtectDetectionSensorEntityDescription, ...] = tuple(
+    ProtectDetectionSensorEntityDescription(
+        key=f"{detection_type}_detections_{window}",
+        name=f"{name} Detections ({window})",
+        icon=icon,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_required_field=required_field,
+        detection_type=detection_type,
+        detection_window=window,
+    )
+    for detection_type, (name, icon, required_field) in _DETECTION_SENSOR_TYPES.items()
+    for window in DETECTION_WINDOWS
+)
+
 SENSE_SENSORS: tuple[ProtectSensorEntityDescription, ...] = (
     ProtectSensorEntityDescription(
         key="battery_level",
@@ -375,6 +465,267 @@ NVR_DISABLED_SENSORS: tuple[ProtectSensorEntityDescription, ...] = (
     ),
 )
 
+NVR_AGGREGATE_SENSORS: tuple[ProtectSensorEntityDescription, ...] = (
+    ProtectSensorEntityDescription(
+        key="total_ingest_rate",
+        name="Total Received Data Rate",
+        native_unit_of_measurement=DATA_RATE_MEGABITS_PER_SECOND,
+        icon="mdi:download-network",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value_fn=_get_aggregate_ingest_rate,
+        precision=3,
+    ),
+    ProtectSensorEntityDescription(
+        key="total_write_rate",
+        name="Total Disk Write Rate",
+        native_unit_of_measurement=DATA_RATE_BYTES_PER_SECOND,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value_fn=_get_aggregate_write_rate,
+        precision=2,
+    ),
+    ProtectSensorEntityDescription(
+        key="cameras_connected",
+        name="Cameras Connected",
+        icon="mdi:cctv",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="connected",
+    ),
+    ProtectSensorEntityDescription(
+        key="cameras_recording",
+        name="Cameras Recording",
+        icon="mdi:record-rec",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="recording",
+    ),
+    ProtectSensorEntityDescription(
+        key="cameras_disconnected",
+        name="Cameras Disconnected",
+        icon="mdi:cctv-off",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="disconnected",
+    ),
+    ProtectSensorEntityDescription(
+        key="storage_full_forecast",
+        name="Estimated Time Until Full",
+        native_unit_of_measurement=TIME_DAYS,
+        icon="mdi:harddisk-plus",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="days_until_full",
+        precision=2,
+    ),
+    ProtectSensorEntityDescription(
+        key="storage_retention_forecast",
+        name="Retention At Current Rate",
+        native_unit_of_measurement=TIME_DAYS,
+        icon="mdi:calendar-clock",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="retention_days",
+        precision=2,
+    ),
+)
+
+NVR_DIAGNOSTIC_SENSORS: tuple[ProtectSensorEntityDescription, ...] = (
+    ProtectSensorEntityDescription(
+        key="ring_latency",
+        name="Doorbell Ring Latency",
+        native_unit_of_measurement=TIME_MILLISECONDS,
+        icon="mdi:doorbell-video",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="ring_latency",
+        precision=2,
+    ),
+    ProtectSensorEntityDescription(
+        key="poll_mode",
+        name="Polling Mode",
+        icon="mdi:sync",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        ufp_value="poll_mode",
+    ),
+    ProtectSensorEntityDescription(
+        key="poll_interval",
+        name="Polling Interval",
+        native_unit_of_measurement=TIME_SECONDS,
+        icon="mdi:timer-sync",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="poll_interval",
+    ),
+    ProtectSensorEntityDescription(
+        key="reconnect_time",
+        name="Websocket Reconnect Time",
+        native_unit_of_measurement=TIME_MILLISECONDS,
+        icon="mdi:lan-pending",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="reconnect_time",
+        precision=1,
+    ),
+    ProtectSensorEntityDescription(
+        key="reconnect_bytes",
+        name="Websocket Reconnect Data",
+        native_unit_of_measurement=DATA_BYTES,
+        icon="mdi:download-network",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="reconnect_bytes",
+    ),
+    ProtectSensorEntityDescription(
+        key="bytes_fetched",
+        name="Data Fetched",
+        native_unit_of_measurement=DATA_BYTES,
+        icon="mdi:download-network",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        ufp_value="bytes_fetched",
+    ),
+    ProtectSensorEntityDescription(
+        key="session_logins",
+        name="Logins",
+        icon="mdi:login",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        ufp_value="session.logins",
+    ),
+    ProtectSensorEntityDescription(
+        key="session_handshakes",
+        name="Connections Opened",
+        icon="mdi:handshake",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        ufp_value="session.handshakes",
+    ),
+    ProtectSensorEntityDescription(
+        key="session_reused",
+        name="Connections Reused",
+        icon="mdi:connection",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        ufp_value="session.traffic.connections_reused",
+    ),
+    ProtectSensorEntityDescription(
+        key="full_refreshes",
+        name="Full Refreshes",
+        icon="mdi:database-refresh",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        ufp_value="full_refreshes",
+    ),
+    ProtectSensorEntityDescription(
+        key="ws_message_rate",
+        name="Websocket Message Rate",
+        native_unit_of_measurement="msg/s",
+        icon="mdi:message-flash",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="metrics.message_rate",
+        precision=2,
+    ),
+    ProtectSensorEntityDescription(
+        key="ws_last_message_age",
+        name="Websocket Last Message Age",
+        native_unit_of_measurement=TIME_SECONDS,
+        icon="mdi:message-badge",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="last_message_age",
+        precision=1,
+    ),
+    ProtectSensorEntityDescription(
+        key="ws_reconnects",
+        name="Websocket Reconnects",
+        icon="mdi:lan-connect",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        ufp_value="metrics.reconnects",
+    ),
+    ProtectSensorEntityDescription(
+        key="ws_processing_p50",
+        name="Websocket Processing Time (p50)",
+        native_unit_of_measurement=TIME_MILLISECONDS,
+        icon="mdi:timer-outline",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="metrics.processing_p50",
+        precision=3,
+    ),
+    ProtectSensorEntityDescription(
+        key="ws_processing_p99",
+        name="Websocket Processing Time (p99)",
+        native_unit_of_measurement=TIME_MILLISECONDS,
+        icon="mdi:timer-alert-outline",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="metrics.processing_p99",
+        precision=3,
+    ),
+    ProtectSensorEntityDescription(
+        key="refresh_time",
+        name="Refresh Time",
+        native_unit_of_measurement=TIME_MILLISECONDS,
+        icon="mdi:timer-refresh-outline",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="metrics.refresh_time",
+        precision=1,
+    ),
+    ProtectSensorEntityDescription(
+        key="loop_time",
+        name="Event Loop Time",
+        native_unit_of_measurement="ms/s",
+        icon="mdi:timer-sand",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        ufp_value="metrics.loop_time",
+        precision=2,
+    ),
+    ProtectSensorEntityDescription(
+        key="ws_deferred",
+        name="Websocket Updates Deferred",
+        icon="mdi:tray-full",
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        ufp_value="metrics.deferred",
+    ),
+)
+
+NVR_DISPATCH_SENSOR = ProtectSensorEntityDescription(
+    key="dispatch_time",
+    name="Update Dispatch Time",
+    native_unit_of_measurement=TIME_MILLISECONDS,
+    icon="mdi:timer-cog-outline",
+    entity_registry_enabled_default=False,
+    entity_category=EntityCategory.DIAGNOSTIC,
+    state_class=SensorStateClass.MEASUREMENT,
+    ufp_value_fn=lambda data: sum(data.metrics.dispatch_time.values()),
+    precision=3,
+)
+
 MOTION_SENSORS: tuple[ProtectSensorEntityDescription, ...] = (
     ProtectSensorEntityDescription(
         key="detected_object",
@@ -384,6 +735,7 @@ MOTION_SENSORS: tuple[ProtectSensorEntityDescription, ...] = (
 )
 
 
+@profile_platform(Platform.SENSOR)
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -391,29 +743,64 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensors for UniFi Protect integration."""
     data: ProtectData = hass.data[DOMAIN][entry.entry_id]
+
+    @callback
+    def _add_new_device(device: ProtectAdoptableDeviceModel) -> None:
+        async_add_entities(async_device_entities(data, device))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, data.adopt_signal, _add_new_device)
+    )
+
+    async_add_entities(data.async_pop_entities(Platform.SENSOR, async_device_entities))
+
+
+@callback
+def async_device_entities(
+    data: ProtectData, device: ProtectDeviceModel
+) -> list[ProtectDeviceEntity]:
+    """Build the sensors of the NVR or a device."""
+    if isinstance(device, NVR):
+        return _async_nvr_entities(data)
+
     entities: list[ProtectDeviceEntity] = async_all_device_entities(
         data,
         ProtectDeviceSensor,
         all_descs=ALL_DEVICES_SENSORS,
         camera_descs=CAMERA_SENSORS + CAMERA_DISABLED_SENSORS,
         sense_descs=SENSE_SENSORS,
+        platform=Platform.SENSOR,
+        ufp_device=device,
     )
-    entities += _async_motion_entities(data)
-    entities += _async_nvr_entities(data)
-
-    async_add_entities(entities)
+    entities += async_all_device_entities(
+        data,
+        ProtectDeviceRateSensor,
+        camera_descs=CAMERA_RATE_SENSORS,
+        platform=Platform.SENSOR,
+        ufp_device=device,
+    )
+    entities += async_all_device_entities(
+        data,
+        ProtectDetectionSensor,
+        camera_descs=CAMERA_DETECTION_SENSORS,
+        platform=Platform.SENSOR,
+        ufp_device=device,
+    )
+    entities += _async_motion_entities(data, device)
+    return entities
 
 
 @callback
 def _async_motion_entities(
-    data: ProtectData,
+    data: ProtectData, device: ProtectDeviceModel
 ) -> list[ProtectDeviceEntity]:
     entities: list[ProtectDeviceEntity] = []
-    for device in data.api.bootstrap.cameras.values():
-        if not device.feature_flags.has_smart_detect:
-            continue
-
+    if isinstance(device, Camera) and device.feature_flags.has_smart_detect:
         for description in MOTION_SENSORS:
+            if data.async_is_entity_disabled(
+                Platform.SENSOR, f"{device.id}_{description.key}"
+            ):
+                continue
             entities.append(ProtectEventSensor(data, device, description))
             _LOGGER.debug(
                 "Adding sensor entity %s for %s",
@@ -430,9 +817,22 @@ def _async_nvr_entities(
 ) -> list[ProtectDeviceEntity]:
     entities: list[ProtectDeviceEntity] = []
     device = data.api.bootstrap.nvr
-    for description in NVR_SENSORS + NVR_DISABLED_SENSORS:
-        entities.append(ProtectNVRSensor(data, device, description))
-        _LOGGER.debug("Adding NVR sensor entity %s", description.name)
+    nvr_entities: list[
+        tuple[type[ProtectNVRSensor], Sequence[ProtectSensorEntityDescription]]
+    ] = [
+        (ProtectNVRSensor, NVR_SENSORS + NVR_DISABLED_SENSORS),
+        (ProtectNVRAggregateSensor, NVR_AGGREGATE_SENSORS),
+        (ProtectNVRDiagnosticSensor, NVR_DIAGNOSTIC_SENSORS),
+        (ProtectNVRDispatchSensor, (NVR_DISPATCH_SENSOR,)),
+    ]
+    for klass, descriptions in nvr_entities:
+        for description in descriptions:
+            if data.async_is_entity_disabled(
+                Platform.SENSOR, f"{device.id}_{description.key}"
+            ):
+                continue
+            entities.append(klass(data, device, description))
+            _LOGGER.debug("Adding NVR sensor entity %s", description.name)
 
     return entities
 
@@ -451,10 +851,78 @@ class ProtectDeviceSensor(ProtectDeviceEntity, SensorEntity):
         """Initialize an UniFi Protect sensor."""
         super().__init__(data, device, description)
 
+    @callback
+    def _async_get_native_value(self) -> Any:
+        """Get the sensor value, to be overridden by child classes."""
+        return self.entity_description.get_ufp_value(self.device)
+
     @callback
     def _async_update_device_from_protect(self) -> None:
         super()._async_update_device_from_protect()
-        self._attr_native_value = self.entity_description.get_ufp_value(self.device)
+        self._attr_native_value = self._async_get_native_value()
+
+
+class ProtectDeviceRateSensor(ProtectDeviceSensor):
+    """A UniFi Protect Sensor deriving a bit rate from a byte counter."""
+
+    def __init__(
+        self,
+        data: ProtectData,
+        device: ProtectAdoptableDeviceModel,
+        description: ProtectSensorEntityDescription,
+    ) -> None:
+        """Initialize an UniFi Protect rate sensor."""
+        self._sampler = ByteRateSampler(data.rate_window.total_seconds())
+        super().__init__(data, device, description)
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.data.async_subscribe_device_id(
+                SIGNAL_OPTIONS, self._async_updated_options
+            )
+        )
+
+    @callback
+    def _async_updated_options(self) -> None:
+        window = self.data.rate_window.total_seconds()
+        if window != self._sampler.window:
+            self._sampler = ByteRateSampler(window)
+
+    @callback
+    def _async_get_native_value(self) -> Any:
+        self._sampler.add(super()._async_get_native_value())
+
+        rate = self._sampler.rate()
+        if rate is None:
+            return None
+        # bits per second to megabits per second
+        return round(rate / 1_000_000, self.entity_description.precision)
+
+
+class ProtectDetectionSensor(ProtectDeviceSensor):
+    """A UniFi Protect Sensor counting detections over a rolling window."""
+
+    device: Camera
+    entity_description: ProtectDetectionSensorEntityDescription
+
+    @callback
+    def _async_get_native_value(self) -> Any:
+        counters = self.data.async_get_detections(self.device.id)
+        return counters.count(
+            self.entity_description.detection_type,
+            self.entity_description.detection_window,
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.data.async_subscribe_device_id(
+                SIGNAL_DETECTIONS, self._async_updated_event
+            )
+        )
 
 
 class ProtectNVRSensor(ProtectNVREntity, SensorEntity):
@@ -471,10 +939,61 @@ class ProtectNVRSensor(ProtectNVREntity, SensorEntity):
         """Initialize an UniFi Protect sensor."""
         super().__init__(data, device, description)
 
+    @callback
+    def _async_get_native_value(self) -> Any:
+        """Get the sensor value, to be overridden by child classes."""
+        return self.entity_description.get_ufp_value(self.device)
+
     @callback
     def _async_update_device_from_protect(self) -> None:
         super()._async_update_device_from_protect()
-        self._attr_native_value = self.entity_description.get_ufp_value(self.device)
+        self._attr_native_value = self._async_get_native_value()
+
+
+class ProtectNVRAggregateSensor(ProtectNVRSensor):
+    """A UniFi Protect Sensor for totals across all devices of a NVR."""
+
+    @callback
+    def _async_get_native_value(self) -> Any:
+        return self.entity_description.get_ufp_value(self.data.aggregates)
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.data.async_subscribe_device_id(
+                SIGNAL_AGGREGATES, self._async_updated_event
+            )
+        )
+
+
+class ProtectNVRDiagnosticSensor(ProtectNVRSensor):
+    """A UniFi Protect Sensor for integration side diagnostics of a NVR."""
+
+    @callback
+    def _async_get_native_value(self) -> Any:
+        return self.entity_description.get_ufp_value(self.data)
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.data.async_subscribe_device_id(
+                SIGNAL_DIAGNOSTICS, self._async_updated_event
+            )
+        )
+
+
+class ProtectNVRDispatchSensor(ProtectNVRDiagnosticSensor):
+    """A UniFi Protect Sensor for the time spent updating entities, per device type."""
+
+    @callback
+    def _async_update_device_from_protect(self) -> None:
+        super()._async_update_device_from_protect()
+        self._attr_extra_state_attributes = {
+            device_type: round(value, 3)
+            for device_type, value in self.data.metrics.dispatch_time.items()
+        }
 
 
 class ProtectEventSensor(ProtectDeviceSensor, EventThumbnailMixin):
@@ -497,10 +1016,9 @@ class ProtectEventSensor(ProtectDeviceSensor, EventThumbnailMixin):
         return event
 
     @callback
-    def _async_update_device_from_protect(self) -> None:
-        # do not call ProtectDeviceSensor method since we want event to get value here
-        EventThumbnailMixin._async_update_device_from_protect(self)
+    def _async_get_native_value(self) -> Any:
+        # EventThumbnailMixin comes after ProtectDeviceSensor in the MRO, so the
+        # event is already updated by the time the value is read
         if self._event is None:
-            self._attr_native_value = OBJECT_TYPE_NONE
-        else:
-            self._attr_native_value = self._event.smart_detect_types[0].value
+            return OBJECT_TYPE_NONE
+        return self._event.smart_detect_types[0].value
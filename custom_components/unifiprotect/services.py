@@ -2,33 +2,49 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import datetime
 import functools
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import ATTR_DEVICE_ID
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from homeassistant.util import dt as dt_util
 from pydantic import ValidationError
 from pyunifiprotect.api import ProtectApiClient
 from pyunifiprotect.exceptions import BadRequest
 import voluptuous as vol
 
-from .const import ATTR_MESSAGE, DOMAIN
+from .const import ATTR_MESSAGE, DOMAIN, EVENT_QUERY_EVENTS_RESULT
 from .data import ProtectData
+from .journal import JOURNAL_MAX_LIMIT
 
 SERVICE_ADD_DOORBELL_TEXT = "add_doorbell_text"
 SERVICE_REMOVE_DOORBELL_TEXT = "remove_doorbell_text"
 SERVICE_SET_DEFAULT_DOORBELL_TEXT = "set_default_doorbell_text"
+SERVICE_QUERY_EVENTS = "query_events"
 
 ALL_GLOBAL_SERIVCES = [
     SERVICE_ADD_DOORBELL_TEXT,
     SERVICE_REMOVE_DOORBELL_TEXT,
     SERVICE_SET_DEFAULT_DOORBELL_TEXT,
+    SERVICE_QUERY_EVENTS,
 ]
 
+ATTR_EVENT_TYPE = "event_type"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_LIMIT = "limit"
+ATTR_CURSOR = "cursor"
+ATTR_REQUEST_ID = "request_id"
+ATTR_EVENTS = "events"
+ATTR_NEXT_CURSOR = "next_cursor"
+
+DATA_DEVICE_INDEX = f"{DOMAIN}_device_index"
+
 DOORBELL_TEXT_SCHEMA = vol.All(
     vol.Schema(
         {
@@ -40,10 +56,25 @@ DOORBELL_TEXT_SCHEMA = vol.All(
 )
 
 
-def _async_all_ufp_instances(hass: HomeAssistant) -> list[ProtectApiClient]:
-    """All active UFP instances."""
+QUERY_EVENTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_EVENT_TYPE): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_LIMIT, default=50): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=JOURNAL_MAX_LIMIT)
+        ),
+        vol.Optional(ATTR_CURSOR): cv.string,
+        vol.Optional(ATTR_REQUEST_ID): cv.string,
+    }
+)
+
+
+def _async_all_ufp_data(hass: HomeAssistant) -> list[ProtectData]:
+    """All active UFP data services."""
     return [
-        data.api for data in hass.data[DOMAIN].values() if isinstance(data, ProtectData)
+        data for data in hass.data[DOMAIN].values() if isinstance(data, ProtectData)
     ]
 
 
@@ -62,53 +93,126 @@ def _async_get_macs_for_device(device_entry: dr.DeviceEntry) -> list[str]:
     ]
 
 
-@callback
-def _async_get_ufp_instances(
-    hass: HomeAssistant, device_id: str
-) -> tuple[dr.DeviceEntry, ProtectApiClient]:
-    device_registry = dr.async_get(hass)
-    if not (device_entry := device_registry.async_get(device_id)):
-        raise HomeAssistantError(f"No device found for device id: {device_id}")
-
-    if device_entry.via_device_id is not None:
-        return _async_get_ufp_instances(hass, device_entry.via_device_id)
-
-    macs = _async_get_macs_for_device(device_entry)
-    ufp_instances = [
-        i for i in _async_all_ufp_instances(hass) if i.bootstrap.nvr.mac in macs
-    ]
+class ProtectDeviceIndex:
+    """Map Home Assistant device IDs to the UniFi Protect data they belong to.
+
+    Devices are indexed when their config entry is loaded and kept up to date
+    from device registry events, so services resolve each targeted device
+    with a dict lookup instead of walking the registry and every NVR.
+    """
 
-    if not ufp_instances:
-        # should not be possible unless user manually enters a bad device ID
-        raise HomeAssistantError(  # pragma: no cover
-            f"No UniFi Protect NVR found for device ID: {device_id}"
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init the index."""
+        self._hass = hass
+        self._data: dict[str, ProtectData] = {}
+        self._devices: dict[str, tuple[ProtectData, str | None]] = {}
+        self._unsub_registry = hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_registry_updated
         )
 
-    return device_entry, ufp_instances[0]
+    @callback
+    def async_add_entry(self, entry_id: str, data: ProtectData) -> None:
+        """Index the devices of a loaded config entry."""
+        self._data[entry_id] = data
+        registry = dr.async_get(self._hass)
+        for device_entry in dr.async_entries_for_config_entry(registry, entry_id):
+            self._async_index(device_entry)
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> None:
+        """Drop the devices of an unloaded config entry.
+
+        The index removes itself once the last config entry is unloaded.
+        """
+        if (data := self._data.pop(entry_id, None)) is None:
+            return
+        if not self._data:
+            self._unsub_registry()
+            self._devices.clear()
+            self._hass.data.pop(DATA_DEVICE_INDEX, None)
+            return
+        self._devices = {
+            device_id: target
+            for device_id, target in self._devices.items()
+            if target[0] is not data
+        }
+
+    @callback
+    def _async_index(
+        self, device_entry: dr.DeviceEntry
+    ) -> tuple[ProtectData, str | None] | None:
+        macs = _async_get_macs_for_device(device_entry)
+        for entry_id in device_entry.config_entries:
+            if (data := self._data.get(entry_id)) is None:
+                continue
+            for mac in macs:
+                if mac == data.api.bootstrap.nvr.mac:
+                    target: tuple[ProtectData, str | None] = (data, None)
+                elif (ufp_device_id := data.async_get_device_id(mac)) is not None:
+                    target = (data, ufp_device_id)
+                else:
+                    continue
+                self._devices[device_entry.id] = target
+                return target
+        return None
+
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        device_id: str = event.data["device_id"]
+        self._devices.pop(device_id, None)
+        if event.data["action"] == "remove":
+            return
+        if (device_entry := dr.async_get(self._hass).async_get(device_id)) is not None:
+            self._async_index(device_entry)
+
+    @callback
+    def async_get(self, device_id: str) -> tuple[ProtectData, str | None]:
+        """Get the data and UFP device ID (None for the NVR) of a HA device."""
+        if (target := self._devices.get(device_id)) is not None:
+            return target
+
+        if not (device_entry := dr.async_get(self._hass).async_get(device_id)):
+            raise HomeAssistantError(f"No device found for device id: {device_id}")
+        if (target := self._async_index(device_entry)) is None:
+            raise HomeAssistantError(
+                f"No UniFi Protect device found for device ID: {device_id}"
+            )
+        return target
+
+
+@callback
+def async_get_device_index(hass: HomeAssistant) -> ProtectDeviceIndex:
+    """Get the device index, creating it on first use."""
+    if (index := hass.data.get(DATA_DEVICE_INDEX)) is None:
+        index = hass.data[DATA_DEVICE_INDEX] = ProtectDeviceIndex(hass)
+    return index
 
 
 @callback
 def _async_get_protect_from_call(
     hass: HomeAssistant, call: ServiceCall
-) -> list[tuple[dr.DeviceEntry, ProtectApiClient]]:
+) -> list[ProtectApiClient]:
     referenced = async_extract_referenced_entity_ids(hass, call)
+    index = async_get_device_index(hass)
 
-    instances: list[tuple[dr.DeviceEntry, ProtectApiClient]] = []
+    # every NVR is called once, no matter how many of its devices are targeted
+    instances: dict[str, ProtectApiClient] = {}
     for device_id in referenced.referenced_devices:
-        instances.append(_async_get_ufp_instances(hass, device_id))
+        data, _ = index.async_get(device_id)
+        instances[data.api.bootstrap.nvr.id] = data.api
 
-    return instances
+    return list(instances.values())
 
 
 async def _async_call_nvr(
-    instances: list[tuple[dr.DeviceEntry, ProtectApiClient]],
+    instances: list[ProtectApiClient],
     method: str,
     *args: Any,
     **kwargs: Any,
 ) -> None:
     try:
         await asyncio.gather(
-            *(getattr(i.bootstrap.nvr, method)(*args, **kwargs) for _, i in instances)
+            *(getattr(i.bootstrap.nvr, method)(*args, **kwargs) for i in instances)
         )
     except (BadRequest, ValidationError) as err:
         raise HomeAssistantError(str(err)) from err
@@ -135,6 +239,65 @@ async def set_default_doorbell_text(hass: HomeAssistant, call: ServiceCall) -> N
     await _async_call_nvr(instances, "set_default_doorbell_message", message)
 
 
+@callback
+def _async_get_query_targets(
+    hass: HomeAssistant, device_id: str | None
+) -> list[tuple[ProtectData, str | None]]:
+    """Get the data services and UFP device ID to filter on for a HA device."""
+    if device_id is None:
+        return [(data, None) for data in _async_all_ufp_data(hass)]
+    return [async_get_device_index(hass).async_get(device_id)]
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    """Convert a service call datetime to UTC, naive ones are local time."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return dt_util.as_utc(value)
+
+
+async def query_events(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Query the local event journals."""
+    limit: int = call.data[ATTR_LIMIT]
+    start = _as_utc(call.data.get(ATTR_START))
+    end = _as_utc(call.data.get(ATTR_END))
+    targets = _async_get_query_targets(hass, call.data.get(ATTR_DEVICE_ID))
+    try:
+        results = await asyncio.gather(
+            *(
+                data.journal.async_query(
+                    device_id=ufp_device_id,
+                    event_type=call.data.get(ATTR_EVENT_TYPE),
+                    start=start,
+                    end=end,
+                    limit=limit,
+                    cursor=call.data.get(ATTR_CURSOR),
+                )
+                for data, ufp_device_id in targets
+            )
+        )
+    except ValueError as err:
+        raise HomeAssistantError(f"Invalid cursor: {err}") from err
+
+    # keyset cursors are shared between NVRs, so pages from each can be merged
+    events = sorted(
+        (row for rows in results for row in rows),
+        key=lambda row: (row[ATTR_START], row["id"]),
+        reverse=True,
+    )[:limit]
+    hass.bus.async_fire(
+        EVENT_QUERY_EVENTS_RESULT,
+        {
+            ATTR_REQUEST_ID: call.data.get(ATTR_REQUEST_ID),
+            ATTR_EVENTS: events,
+            ATTR_NEXT_CURSOR: events[-1]["cursor"] if len(events) == limit else None,
+        },
+        context=call.context,
+    )
+
+
 def async_setup_services(hass: HomeAssistant) -> None:
     """Set up the global UniFi Protect services."""
     services = [
@@ -153,6 +316,11 @@ def async_setup_services(hass: HomeAssistant) -> None:
             functools.partial(set_default_doorbell_text, hass),
             DOORBELL_TEXT_SCHEMA,
         ),
+        (
+            SERVICE_QUERY_EVENTS,
+            functools.partial(query_events, hass),
+            QUERY_EVENTS_SCHEMA,
+        ),
     ]
     for name, method, schema in services:
         if hass.services.has_service(DOMAIN, name):
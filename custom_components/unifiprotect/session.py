@@ -0,0 +1,185 @@
+"""Shared NVR sessions for UniFi Protect Integration."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+import logging
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    CookieJar,
+    TCPConnector,
+    TraceConfig,
+    TraceRequestEndParams,
+)
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_PORT,
+    CONF_USERNAME,
+    CONF_VERIFY_SSL,
+    EVENT_HOMEASSISTANT_CLOSE,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.ssl import client_context
+from pyunifiprotect import ProtectApiClient
+
+from .const import (
+    CONF_KEEPALIVE,
+    CONF_MAX_CONNECTIONS,
+    CONF_OVERRIDE_CHOST,
+    DEFAULT_KEEPALIVE,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_PORT,
+    DEFAULT_VERIFY_SSL,
+    DEVICES_FOR_SUBSCRIBE,
+    DOMAIN,
+)
+from .utils import TrafficCounter
+
+_LOGGER = logging.getLogger(__name__)
+
+AUTH_PATH = "/api/auth/login"
+DATA_SESSIONS = f"{DOMAIN}_sessions"
+# keep released sessions warm so a validated login is reused by the entry
+SESSION_IDLE_TIMEOUT = 60
+
+
+class ProtectSession:
+    """An API client and its connection pool for one NVR login."""
+
+    def __init__(
+        self,
+        key: tuple[Any, ...],
+        data: Mapping[str, Any],
+        options: Mapping[str, Any],
+    ) -> None:
+        """Init the session."""
+        self.key = key
+        self.logins = 0
+        self.refs = 0
+        self.traffic = TrafficCounter()
+        self.unsub_close: CALLBACK_TYPE | None = None
+
+        verify_ssl = data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL)
+        auth_trace = TraceConfig()
+        auth_trace.on_request_end.append(self._on_request_end)
+        self.session = ClientSession(
+            connector=TCPConnector(
+                limit=options.get(CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS),
+                keepalive_timeout=options.get(CONF_KEEPALIVE, DEFAULT_KEEPALIVE),
+                ssl=client_context() if verify_ssl else False,
+            ),
+            cookie_jar=CookieJar(unsafe=True),
+            trace_configs=[self.traffic.trace_config, auth_trace],
+        )
+        self.api = ProtectApiClient(
+            host=data[CONF_HOST],
+            port=data.get(CONF_PORT, DEFAULT_PORT),
+            username=data[CONF_USERNAME],
+            password=data[CONF_PASSWORD],
+            verify_ssl=verify_ssl,
+            session=self.session,
+            subscribed_models=DEVICES_FOR_SUBSCRIBE,
+            override_connection_host=options.get(CONF_OVERRIDE_CHOST, False),
+        )
+
+    async def _on_request_end(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceRequestEndParams,
+    ) -> None:
+        if params.url.path == AUTH_PATH:
+            self.logins += 1
+
+    @property
+    def handshakes(self) -> int:
+        """Number of connections opened to the NVR."""
+        return self.traffic.connections_created
+
+
+class ProtectSessionManager:
+    """Share sessions per NVR login across config flows and config entries.
+
+    Validating the login in a config flow, reauthenticating and running the
+    entry all use the same API client, so its TLS connections and login are
+    reused instead of being set up again each time.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init the manager."""
+        self._hass = hass
+        self._sessions: dict[tuple[Any, ...], ProtectSession] = {}
+
+    @callback
+    def async_acquire(
+        self, data: Mapping[str, Any], options: Mapping[str, Any]
+    ) -> ProtectSession:
+        """Get the session for a login, creating it if needed."""
+        key = (
+            data[CONF_HOST],
+            data.get(CONF_PORT, DEFAULT_PORT),
+            data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
+            data[CONF_USERNAME],
+            data[CONF_PASSWORD],
+            options.get(CONF_OVERRIDE_CHOST, False),
+            options.get(CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS),
+            options.get(CONF_KEEPALIVE, DEFAULT_KEEPALIVE),
+        )
+        if (session := self._sessions.get(key)) is None:
+            _LOGGER.debug("Creating session for %s", data[CONF_HOST])
+            session = self._sessions[key] = ProtectSession(key, data, options)
+        elif session.unsub_close is not None:
+            session.unsub_close()
+            session.unsub_close = None
+
+        # client state like ignoring stats is owned by the ProtectData of the
+        # entry, flows validating a login must not change it
+        session.refs += 1
+        return session
+
+    @callback
+    def async_release(self, session: ProtectSession) -> None:
+        """Release a session, it is closed once it has been idle for a while."""
+        session.refs -= 1
+        if session.refs > 0:
+            return
+
+        async def _async_close(*_: Any) -> None:
+            session.unsub_close = None
+            if session.refs == 0 and self._sessions.get(session.key) is session:
+                await self._async_close(session)
+
+        session.unsub_close = async_call_later(
+            self._hass, SESSION_IDLE_TIMEOUT, _async_close
+        )
+
+    async def _async_close(self, session: ProtectSession) -> None:
+        _LOGGER.debug(
+            "Closing session for %s after %s logins and %s handshakes",
+            session.key[0],
+            session.logins,
+            session.handshakes,
+        )
+        del self._sessions[session.key]
+        await session.session.close()
+
+    async def async_close_all(self, *_: Any) -> None:
+        """Close all sessions."""
+        for session in list(self._sessions.values()):
+            if session.unsub_close is not None:
+                session.unsub_close()
+                session.unsub_close = None
+            await self._async_close(session)
+
+
+@callback
+def async_get_session_manager(hass: HomeAssistant) -> ProtectSessionManager:
+    """Get the session manager, creating it on first use."""
+    if (manager := hass.data.get(DATA_SESSIONS)) is None:
+        manager = hass.data[DATA_SESSIONS] = ProtectSessionManager(hass)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, manager.async_close_all)
+    return manager
@@ -0,0 +1,417 @@
+"""Locally derived statistics for UniFi Protect Integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import time
+from typing import Any
+
+from pyunifiprotect.data import NVR, Camera, Event, EventType, ModelType, StateType
+from pyunifiprotect.data.types import SmartDetectObjectType
+
+from .utils import (
+    ByteRateSampler,
+    LatencyHistogram,
+    OnlineLinearRegression,
+    RollingCounter,
+    get_nested_attr,
+)
+
+SECONDS_PER_DAY = 86400
+# how quickly older utilization samples stop influencing the storage forecast
+STORAGE_FORECAST_HALF_LIFE = SECONDS_PER_DAY
+
+DETECTION_MOTION = "motion"
+DETECTION_RING = "ring"
+DETECTION_PERSON = "person"
+DETECTION_VEHICLE = "vehicle"
+DETECTION_TYPES = (
+    DETECTION_MOTION,
+    DETECTION_RING,
+    DETECTION_PERSON,
+    DETECTION_VEHICLE,
+)
+
+# window name: (window length in seconds, number of buckets)
+DETECTION_WINDOWS: dict[str, tuple[int, int]] = {
+    "1h": (3600, 60),
+    "24h": (SECONDS_PER_DAY, 96),
+    "7d": (7 * SECONDS_PER_DAY, 168),
+}
+
+STATS_POLICY_ALL = "all"
+STATS_POLICY_NONE = "none"
+# device types and fields that only change because of periodic stats
+STATS_DEVICE_TYPES = {
+    ModelType.CAMERA.value,
+    ModelType.LIGHT.value,
+    ModelType.NVR.value,
+    ModelType.SENSOR.value,
+    ModelType.VIEWPORT.value,
+}
+STATS_FIELDS = {
+    "last_seen",
+    "phy_rate",
+    "recording_schedules",
+    "stats",
+    "storage_stats",
+    "system_info",
+    "up_since",
+    "uptime",
+    "wifi_connection_state",
+}
+
+EVENT_TYPE_TO_DETECTION = {
+    EventType.MOTION: DETECTION_MOTION,
+    EventType.RING: DETECTION_RING,
+}
+SMART_TYPE_TO_DETECTION = {
+    SmartDetectObjectType.PERSON: DETECTION_PERSON,
+    SmartDetectObjectType.VEHICLE: DETECTION_VEHICLE,
+}
+
+
+class StorageForecast:
+    """Forecast NVR storage exhaustion from utilization and write rate."""
+
+    def __init__(self) -> None:
+        """Init the forecast."""
+        self.utilization: float | None = None
+        self.size: int | None = None
+        self.is_recycling = False
+        self._trend = OnlineLinearRegression(STORAGE_FORECAST_HALF_LIFE)
+
+    def update_nvr(self, nvr: NVR) -> None:
+        """Add a sample from the NVR storage stats."""
+        self.size = get_nested_attr(nvr, "system_info.storage.size")
+        self.is_recycling = bool(
+            get_nested_attr(nvr, "system_info.storage.is_recycling")
+        )
+        self.utilization = get_nested_attr(nvr, "storage_stats.utilization")
+        if self.utilization is not None:
+            self._trend.add(self.utilization)
+
+    def seconds_until_full(self, write_rate: float) -> float | None:
+        """Estimate seconds until the disk is full and rotation starts."""
+        if self.is_recycling:
+            return 0
+        if self.utilization is None:
+            return None
+
+        remaining = max(100 - self.utilization, 0)
+        # prefer the observed utilization trend, it accounts for deletions
+        slope = self._trend.slope
+        if slope is not None and slope > 0:
+            return remaining / slope
+        if self.size and write_rate > 0:
+            return remaining / 100 * self.size / write_rate
+        return None
+
+    def retention(self, write_rate: float) -> float | None:
+        """Estimate seconds of recordings the disk holds at the write rate."""
+        if not self.size or write_rate <= 0:
+            return None
+        return self.size / write_rate
+
+
+class DetectionCounters:
+    """Rolling detection counts for a single camera."""
+
+    def __init__(self) -> None:
+        """Init the counters."""
+        self._counters = {
+            detection_type: {
+                name: RollingCounter(window, buckets)
+                for name, (window, buckets) in DETECTION_WINDOWS.items()
+            }
+            for detection_type in DETECTION_TYPES
+        }
+
+    def add(self, detection_type: str, now: float | None = None) -> None:
+        """Count a detection in every window."""
+        for counter in self._counters[detection_type].values():
+            counter.add(now=now)
+
+    def add_record(
+        self, event_type: str, smart_detect_types: Iterable[str], now: float
+    ) -> None:
+        """Count the detections of an event stored in the journal."""
+        try:
+            detection_type = EVENT_TYPE_TO_DETECTION.get(EventType(event_type))
+        except ValueError:
+            return
+        if detection_type is not None:
+            self.add(detection_type, now)
+            return
+        if event_type != EventType.SMART_DETECT.value:
+            return
+
+        for smart_type in smart_detect_types:
+            try:
+                detection_type = SMART_TYPE_TO_DETECTION.get(
+                    SmartDetectObjectType(smart_type)
+                )
+            except ValueError:
+                continue
+            if detection_type is not None:
+                self.add(detection_type, now)
+
+    def add_event(self, event: Event, old_event: Event | None = None) -> None:
+        """Count the detections of a new or updated event."""
+        if old_event is None and (
+            detection_type := EVENT_TYPE_TO_DETECTION.get(event.type)
+        ):
+            self.add(detection_type)
+
+        if event.type != EventType.SMART_DETECT:
+            return
+
+        # smart detect types can be added to an event while it is ongoing
+        old_types = set() if old_event is None else set(old_event.smart_detect_types)
+        for smart_type in set(event.smart_detect_types) - old_types:
+            if detection_type := SMART_TYPE_TO_DETECTION.get(smart_type):
+                self.add(detection_type)
+
+    def count(self, detection_type: str, window: str) -> int:
+        """Return the number of detections inside the window."""
+        return self._counters[detection_type][window].total()
+
+
+@dataclass(frozen=True)
+class CameraContribution:
+    """What a single camera adds to the NVR wide totals."""
+
+    ingest_rate: float = 0.0
+    write_rate: float = 0.0
+    is_connected: bool = False
+    is_recording: bool = False
+
+
+class ProtectAggregates:
+    """NVR wide totals kept up to date incrementally from camera updates.
+
+    Every camera update swaps out the previous contribution of that camera
+    for the new one, so the cost of an update does not depend on the number
+    of cameras.
+    """
+
+    def __init__(self, rate_window: float) -> None:
+        """Init the aggregates."""
+        self.ingest_rate = 0.0
+        self.write_rate = 0.0
+        self.connected = 0
+        self.disconnected = 0
+        self.recording = 0
+
+        self.storage = StorageForecast()
+
+        self._rate_window = rate_window
+        self._contributions: dict[str, CameraContribution] = {}
+        self._samplers: dict[str, ByteRateSampler] = {}
+
+    @property
+    def camera_ids(self) -> set[str]:
+        """IDs of all cameras currently contributing to the totals."""
+        return set(self._contributions)
+
+    def _apply(self, contribution: CameraContribution, sign: int) -> None:
+        self.ingest_rate += sign * contribution.ingest_rate
+        self.write_rate += sign * contribution.write_rate
+        if contribution.is_connected:
+            self.connected += sign
+        else:
+            self.disconnected += sign
+        if contribution.is_recording:
+            self.recording += sign
+
+    @property
+    def days_until_full(self) -> float | None:
+        """Estimated days until the NVR storage is full."""
+        if (seconds := self.storage.seconds_until_full(self.write_rate)) is None:
+            return None
+        return seconds / SECONDS_PER_DAY
+
+    @property
+    def retention_days(self) -> float | None:
+        """Estimated days of retention at the current write rate."""
+        if (seconds := self.storage.retention(self.write_rate)) is None:
+            return None
+        return seconds / SECONDS_PER_DAY
+
+    def update_nvr(self, nvr: NVR) -> None:
+        """Update the storage forecast from the NVR."""
+        self.storage.update_nvr(nvr)
+
+    def update_camera(self, camera: Camera) -> bool:
+        """Update the contribution of a camera, returns if the totals changed."""
+        if (sampler := self._samplers.get(camera.id)) is None:
+            sampler = self._samplers[camera.id] = ByteRateSampler(self._rate_window)
+        sampler.add(get_nested_attr(camera, "stats.rx_bytes"))
+
+        is_connected = camera.state == StateType.CONNECTED
+        new = CameraContribution(
+            ingest_rate=sampler.rate() or 0.0,
+            write_rate=get_nested_attr(camera, "stats.storage.rate") or 0.0,
+            is_connected=is_connected,
+            is_recording=is_connected and camera.is_recording,
+        )
+        old = self._contributions.get(camera.id)
+        if old == new:
+            return False
+
+        if old is not None:
+            self._apply(old, -1)
+        self._apply(new, 1)
+        self._contributions[camera.id] = new
+        return True
+
+    def recalculate(self) -> None:
+        """Rebuild the totals from the camera contributions.
+
+        Adding and subtracting float rates leaves rounding errors behind, so
+        the totals are rebuilt now and then to stop them from drifting.
+        """
+        self.ingest_rate = 0.0
+        self.write_rate = 0.0
+        self.connected = 0
+        self.disconnected = 0
+        self.recording = 0
+        for contribution in self._contributions.values():
+            self._apply(contribution, 1)
+
+    def remove_camera(self, camera_id: str) -> bool:
+        """Remove the contribution of a camera, returns if the totals changed."""
+        self._samplers.pop(camera_id, None)
+        if (old := self._contributions.pop(camera_id, None)) is None:
+            return False
+
+        self._apply(old, -1)
+        return True
+
+
+class ProtectMetrics:
+    """Counters of how UniFi Protect updates are received and dispatched.
+
+    Recording only bumps counters; rates and percentiles are computed when a
+    window is published and the window counters are then reset.
+    """
+
+    def __init__(self) -> None:
+        """Init the metrics."""
+        self.messages = 0
+        self.reconnects = 0
+        self.processing = LatencyHistogram()
+        self.dispatch: dict[str, float] = {}
+        self.refresh_time: float | None = None
+        self.deferred = 0
+        self.busy = 0.0
+        self._window_start = time.monotonic()
+        self._window_messages = 0
+
+        self.message_rate: float | None = None
+        self.processing_p50: float | None = None
+        self.processing_p99: float | None = None
+        self.dispatch_time: dict[str, float] = {}
+        self.loop_time: float | None = None
+
+    def add_dispatch(self, device_type: str, seconds: float) -> None:
+        """Record time spent calling the callbacks of one device."""
+        self.dispatch[device_type] = self.dispatch.get(device_type, 0) + seconds
+
+    def publish(self, now: float | None = None) -> None:
+        """Compute the values of the current window and start a new one."""
+        if now is None:
+            now = time.monotonic()
+
+        elapsed = now - self._window_start
+        if elapsed > 0:
+            self.message_rate = (self.messages - self._window_messages) / elapsed
+            # milliseconds of event loop time per second
+            self.loop_time = self.busy * 1000 / elapsed
+        self.processing_p50 = self.processing.percentile(50)
+        self.processing_p99 = self.processing.percentile(99)
+        self.dispatch_time = {
+            device_type: seconds * 1000
+            for device_type, seconds in sorted(self.dispatch.items())
+        }
+
+        self.processing.clear()
+        self.dispatch = {}
+        self.busy = 0.0
+        self._window_start = now
+        self._window_messages = self.messages
+
+
+class StatsFilter:
+    """Decide which stats-only Websocket updates are dispatched to entities.
+
+    The policy is a comma separated list of ``<device type>[.<field>]=<rule>``
+    where the rule is ``all``, ``none`` or a number of seconds to sample the
+    field at, i.e. ``camera.stats=all, nvr.system_info=60, sensor=none``. A
+    field rule wins over a device type rule, which wins over ``default``.
+    """
+
+    def __init__(self, policy: str, default: str = STATS_POLICY_NONE) -> None:
+        """Init the filter, raising ValueError for an invalid policy."""
+        rules = parse_stats_policy(policy)
+        self._rules: dict[tuple[str, str], str | float] = {}
+        for device_type in STATS_DEVICE_TYPES:
+            type_rule = rules.get((device_type, None), default)
+            for field in STATS_FIELDS:
+                self._rules[(device_type, field)] = rules.get(
+                    (device_type, field), type_rule
+                )
+        self._last_sample: dict[tuple[str, str], float] = {}
+
+    def allow(
+        self,
+        device_type: str,
+        device_id: str,
+        changed_data: dict[str, Any],
+        now: float | None = None,
+    ) -> bool:
+        """Return if an update of a device should be dispatched."""
+        stats = changed_data.keys() & STATS_FIELDS
+        # updates with anything else than stats always go through
+        if len(stats) < len(changed_data):
+            return True
+
+        allowed = False
+        for field in stats:
+            rule = self._rules.get((device_type, field), STATS_POLICY_ALL)
+            if rule == STATS_POLICY_ALL:
+                allowed = True
+            elif rule != STATS_POLICY_NONE:
+                if now is None:
+                    now = time.monotonic()
+                key = (device_id, field)
+                last = self._last_sample.get(key)
+                if last is None or now - last >= rule:
+                    self._last_sample[key] = now
+                    allowed = True
+        return allowed
+
+
+def parse_stats_policy(policy: str) -> dict[tuple[str, str | None], str | float]:
+    """Parse a stats filter policy, raising ValueError if it is invalid."""
+    rules: dict[tuple[str, str | None], str | float] = {}
+    for part in policy.split(","):
+        if not (part := part.strip()):
+            continue
+
+        target, sep, value = part.partition("=")
+        if not sep:
+            raise ValueError(f"Missing rule for {part}")
+        device_type, _, field = target.strip().partition(".")
+        if device_type not in STATS_DEVICE_TYPES:
+            raise ValueError(f"Unknown device type {device_type}")
+        if field and field not in STATS_FIELDS:
+            raise ValueError(f"Unknown stats field {field}")
+
+        rule: str | float = value.strip().lower()
+        if rule not in (STATS_POLICY_ALL, STATS_POLICY_NONE):
+            rule = float(rule)
+            if rule <= 0:
+                raise ValueError(f"Invalid sample interval for {part}")
+        rules[(device_type, field or None)] = rule
+    return rules
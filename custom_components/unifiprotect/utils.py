@@ -1,9 +1,32 @@
 """UniFi Protect Integration utils."""
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from collections.abc import Callable, Hashable
 from enum import Enum
+import math
+import time
+from types import SimpleNamespace
 from typing import Any
 
+from aiohttp import (
+    ClientSession,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionReuseconnParams,
+    TraceResponseChunkReceivedParams,
+)
+
+HISTOGRAM_BUCKETS_PER_OCTAVE = 4
+HISTOGRAM_MAX_OCTAVE = 24
+LIVENESS_ALPHA = 0.1
+LIVENESS_STALE_FACTOR = 10
+LIVENESS_MIN_WINDOW = 60.0
+RATE_MAX_GAP = 15 * 60
+RATE_SAMPLE_SIZE = 30
+TIMER_RESOLUTION = 0.25
+
 
 def get_nested_attr(obj: Any, attr: str) -> Any:
     """Fetch a nested attribute."""
@@ -19,3 +42,412 @@ def get_nested_attr(obj: Any, attr: str) -> Any:
         value = value.value
 
     return value
+
+
+class ByteRateSampler:
+    """Derive a rate from a cumulative byte counter.
+
+    Samples are kept in a fixed-size ring buffer spaced evenly across the
+    window so memory stays constant no matter how often the counter updates.
+    Only changes of the counter are sampled: without realtime stats the
+    counter is only refreshed every few minutes while other updates of the
+    device repeat the old value, so the rate spans the time between changes.
+    A counter that has not changed for ``max_gap`` seconds is sampled again,
+    so a stopped stream drops to zero.
+    """
+
+    def __init__(
+        self,
+        window: float,
+        size: int = RATE_SAMPLE_SIZE,
+        max_gap: float = RATE_MAX_GAP,
+    ) -> None:
+        """Init the sampler."""
+        self.window = window
+        self._spacing = window / size
+        self._max_gap = max_gap
+        self._samples: deque[tuple[float, int]] = deque(maxlen=size + 1)
+
+    def add(self, value: int | None, now: float | None = None) -> None:
+        """Add a counter sample."""
+        if value is None:
+            return
+        if now is None:
+            now = time.monotonic()
+
+        if self._samples:
+            last_time, last_value = self._samples[-1]
+            # repeated value, the counter was not refreshed
+            if value == last_value and now - last_time < self._max_gap:
+                return
+            # counter went backwards (device reboot or stats reset), start over
+            if value < last_value:
+                self._samples.clear()
+            # too close to the previous sample, move it forward instead
+            elif len(self._samples) > 1 and now - self._samples[-2][0] < self._spacing:
+                self._samples[-1] = (now, value)
+                return
+            elif now == last_time:
+                self._samples[-1] = (now, value)
+                return
+
+        self._samples.append((now, value))
+
+    def rate(self) -> float | None:
+        """Return the average rate over the window in bits per second."""
+        if len(self._samples) < 2:
+            return None
+
+        newest_time, newest_value = self._samples[-1]
+        oldest_time, oldest_value = self._samples[-2]
+        for sample_time, sample_value in self._samples:
+            if newest_time - sample_time <= self.window:
+                if sample_time < newest_time:
+                    oldest_time, oldest_value = sample_time, sample_value
+                break
+
+        return (newest_value - oldest_value) * 8 / (newest_time - oldest_time)
+
+
+class OnlineLinearRegression:
+    """Exponentially weighted least squares fit of a value over time.
+
+    Only running sums are kept, older samples fade out with the given half life.
+    """
+
+    def __init__(self, half_life: float) -> None:
+        """Init the regression."""
+        self._half_life = half_life
+        self._origin: float | None = None
+        self._last_x = 0.0
+        self._sw = 0.0
+        self._sx = 0.0
+        self._sy = 0.0
+        self._sxx = 0.0
+        self._sxy = 0.0
+        self.samples = 0
+
+    def add(self, value: float, now: float | None = None) -> None:
+        """Add a sample."""
+        if now is None:
+            now = time.monotonic()
+        if self._origin is None:
+            self._origin = now
+
+        x = now - self._origin
+        decay = 0.5 ** ((x - self._last_x) / self._half_life)
+        self._sw = self._sw * decay + 1
+        self._sx = self._sx * decay + x
+        self._sy = self._sy * decay + value
+        self._sxx = self._sxx * decay + x * x
+        self._sxy = self._sxy * decay + x * value
+        self._last_x = x
+        self.samples += 1
+
+    @property
+    def slope(self) -> float | None:
+        """Return change of value per second."""
+        if self.samples < 2:
+            return None
+
+        denominator = self._sw * self._sxx - self._sx * self._sx
+        if denominator <= 0:
+            return None
+        return (self._sw * self._sxy - self._sx * self._sy) / denominator
+
+
+class LatencyHistogram:
+    """Histogram of durations with logarithmic buckets.
+
+    Durations are bucketed in quarter octaves of microseconds, so percentiles
+    are accurate to about 20% while recording stays a couple of arithmetic
+    operations.
+    """
+
+    def __init__(self) -> None:
+        """Init the histogram."""
+        self._counts = [0] * (HISTOGRAM_BUCKETS_PER_OCTAVE * HISTOGRAM_MAX_OCTAVE + 1)
+        self.count = 0
+
+    def add(self, seconds: float) -> None:
+        """Record a duration."""
+        micros = seconds * 1_000_000
+        index = 0
+        if micros > 1:
+            index = min(
+                int(math.log2(micros) * HISTOGRAM_BUCKETS_PER_OCTAVE) + 1,
+                len(self._counts) - 1,
+            )
+        self._counts[index] += 1
+        self.count += 1
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the upper bound of the given percentile in milliseconds."""
+        if self.count == 0:
+            return None
+
+        rank = math.ceil(self.count * percent / 100)
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                break
+        return 2 ** (index / HISTOGRAM_BUCKETS_PER_OCTAVE) / 1000
+
+    def clear(self) -> None:
+        """Forget all durations."""
+        self._counts = [0] * len(self._counts)
+        self.count = 0
+
+
+class Liveness:
+    """Liveness score of a message stream from its inter-arrival times.
+
+    The score halves every time the age of the last message grows by the
+    expected silence, ``LIVENESS_STALE_FACTOR`` times the moving average of
+    the inter-arrival time but at least ``min_window`` seconds.
+    """
+
+    def __init__(
+        self, alpha: float = LIVENESS_ALPHA, min_window: float = LIVENESS_MIN_WINDOW
+    ) -> None:
+        """Init the score."""
+        self._alpha = alpha
+        self._min_window = min_window
+        self._interval: float | None = None
+        self.last: float | None = None
+
+    def add(self, now: float | None = None) -> None:
+        """Record a message."""
+        if now is None:
+            now = time.monotonic()
+        if self.last is not None:
+            interval = now - self.last
+            if self._interval is None:
+                self._interval = interval
+            else:
+                self._interval += self._alpha * (interval - self._interval)
+        self.last = now
+
+    def score(self, now: float | None = None) -> float:
+        """Return the liveness between 0 (silent) and 1 (just got a message)."""
+        if self.last is None:
+            return 0.0
+        if now is None:
+            now = time.monotonic()
+
+        expected = self._min_window
+        if self._interval is not None:
+            expected = max(expected, self._interval * LIVENESS_STALE_FACTOR)
+        return 0.5 ** ((now - self.last) / expected)
+
+    def is_alive(self, now: float | None = None) -> bool:
+        """Return if the stream has not been silent for longer than expected."""
+        return self.score(now) >= 0.5
+
+
+class RollingCounter:
+    """Count occurrences over a rolling window using fixed time buckets."""
+
+    def __init__(self, window: float, buckets: int) -> None:
+        """Init the counter."""
+        self._bucket_size = window / buckets
+        self._buckets = [0] * buckets
+        self._head: int | None = None
+        self._total = 0
+
+    def _advance(self, now: float) -> int:
+        index = int(now // self._bucket_size)
+        if self._head is None:
+            self._head = index
+            return index
+
+        steps = index - self._head
+        if steps <= 0:
+            return self._head
+
+        size = len(self._buckets)
+        if steps >= size:
+            self._buckets = [0] * size
+            self._total = 0
+        else:
+            for step in range(1, steps + 1):
+                slot = (self._head + step) % size
+                self._total -= self._buckets[slot]
+                self._buckets[slot] = 0
+        self._head = index
+        return index
+
+    def add(self, count: int = 1, now: float | None = None) -> None:
+        """Count an occurrence, occurrences in the past go to their own bucket."""
+        if now is None:
+            now = time.monotonic()
+        head = self._advance(now)
+        index = int(now // self._bucket_size)
+        if head - index >= len(self._buckets):
+            # already outside the window
+            return
+        self._buckets[min(index, head) % len(self._buckets)] += count
+        self._total += count
+
+    def total(self, now: float | None = None) -> int:
+        """Return occurrences inside the window."""
+        if now is None:
+            now = time.monotonic()
+        self._advance(now)
+        return self._total
+
+
+class LoopBudget:
+    """Event loop time allowed for a task per fixed window.
+
+    Time is charged to the window it is spent in. Once a window's budget is
+    used up, the task should defer its work to the next window.
+    """
+
+    def __init__(self, budget: float, window: float = 1.0) -> None:
+        """Init the budget."""
+        self.budget = budget
+        self.window = window
+        self._window_start = 0.0
+        self._used = 0.0
+
+    def _roll(self, now: float) -> None:
+        if now - self._window_start >= self.window:
+            self._window_start = now - (now - self._window_start) % self.window
+            self._used = 0.0
+
+    def add(self, seconds: float, now: float | None = None) -> None:
+        """Charge time spent on the loop."""
+        if now is None:
+            now = time.monotonic()
+        self._roll(now)
+        self._used += seconds
+
+    def exhausted(self, now: float | None = None) -> bool:
+        """Check if the budget of the current window is used up."""
+        if now is None:
+            now = time.monotonic()
+        self._roll(now)
+        return self._used >= self.budget
+
+    def next_window(self, now: float | None = None) -> float:
+        """Seconds until the next window starts."""
+        if now is None:
+            now = time.monotonic()
+        self._roll(now)
+        return self._window_start + self.window - now
+
+
+class TimerWheel:
+    """Run keyed delayed callbacks using a single event loop timer.
+
+    Callbacks are grouped into slots of `resolution` seconds and only the
+    earliest occupied slot is armed, so any number of pending delays costs
+    one loop timer.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, resolution: float = TIMER_RESOLUTION
+    ) -> None:
+        """Init the timer wheel."""
+        self._loop = loop
+        self._resolution = resolution
+        self._slots: dict[int, dict[Hashable, Callable[[], None]]] = {}
+        self._keys: dict[Hashable, int] = {}
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_tick: int | None = None
+
+    def schedule(self, key: Hashable, delay: float, action: Callable[[], None]) -> None:
+        """Schedule action to run after delay, replacing any pending one for key."""
+        self.cancel(key)
+        tick = math.ceil((self._loop.time() + delay) / self._resolution)
+        self._slots.setdefault(tick, {})[key] = action
+        self._keys[key] = tick
+        if self._handle_tick is None or tick < self._handle_tick:
+            self._arm(tick)
+
+    def cancel(self, key: Hashable) -> None:
+        """Cancel the pending action for key."""
+        if (tick := self._keys.pop(key, None)) is None:
+            return
+        if (slot := self._slots.get(tick)) is not None:
+            slot.pop(key, None)
+            if not slot:
+                del self._slots[tick]
+
+    def is_scheduled(self, key: Hashable) -> bool:
+        """Return if an action is pending for key."""
+        return key in self._keys
+
+    def stop(self) -> None:
+        """Cancel all pending actions."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = None
+        self._handle_tick = None
+        self._slots.clear()
+        self._keys.clear()
+
+    def _arm(self, tick: int) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle_tick = tick
+        self._handle = self._loop.call_at(tick * self._resolution, self._fire)
+
+    def _fire(self) -> None:
+        self._handle = None
+        self._handle_tick = None
+
+        now_tick = math.floor(self._loop.time() / self._resolution)
+        for tick in sorted(tick for tick in self._slots if tick <= now_tick):
+            slot = self._slots.pop(tick)
+            for key in slot:
+                del self._keys[key]
+            for action in slot.values():
+                action()
+
+        if self._slots and self._handle is None:
+            self._arm(min(self._slots))
+
+
+class TrafficCounter:
+    """Count the response bytes and connections of an aiohttp session.
+
+    Every created connection costs a TCP (and TLS) handshake, reused ones come
+    from the keep-alive pool.
+    """
+
+    def __init__(self) -> None:
+        """Init the counter."""
+        self.bytes_received = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.trace_config = TraceConfig()
+        self.trace_config.on_response_chunk_received.append(self._on_chunk)
+        self.trace_config.on_connection_create_end.append(self._on_create)
+        self.trace_config.on_connection_reuseconn.append(self._on_reuse)
+
+    async def _on_chunk(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceResponseChunkReceivedParams,
+    ) -> None:
+        self.bytes_received += len(params.chunk)
+
+    async def _on_create(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionCreateEndParams,
+    ) -> None:
+        self.connections_created += 1
+
+    async def _on_reuse(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionReuseconnParams,
+    ) -> None:
+        self.connections_reused += 1
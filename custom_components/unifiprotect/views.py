@@ -0,0 +1,192 @@
+"""UniFi Protect Integration views."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from http import HTTPStatus
+import logging
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import STORAGE_DIR
+from pyunifiprotect.exceptions import NvrError
+
+from .cache import ProtectFileCache
+from .const import DOMAIN
+from .data import ProtectData
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_VIEWS = f"{DOMAIN}_views"
+VIDEO_CHUNK_SIZE = 64 * 1024
+CACHE_IMMUTABLE = "private, max-age=31536000, immutable"
+CACHE_NO_STORE = "no-store"
+
+
+@callback
+def async_setup_views(hass: HomeAssistant) -> None:
+    """Register the UniFi Protect views once."""
+    if hass.data.get(DATA_VIEWS):
+        return
+
+    hass.data[DATA_VIEWS] = True
+    cache = ProtectFileCache(hass, hass.config.path(STORAGE_DIR, DOMAIN, "cache"))
+    hass.http.register_view(ThumbnailProxyView(hass, cache))
+    hass.http.register_view(HeatmapProxyView(hass, cache))
+    hass.http.register_view(VideoProxyView(hass))
+
+
+@callback
+def async_generate_thumbnail_url(entry_id: str, event_id: str) -> str:
+    """Generate the URL of the thumbnail of an event."""
+    return ThumbnailProxyView.url.format(entry_id=entry_id, event_id=event_id)
+
+
+@callback
+def async_generate_heatmap_url(entry_id: str, event_id: str) -> str:
+    """Generate the URL of the heatmap of an event."""
+    return HeatmapProxyView.url.format(entry_id=entry_id, event_id=event_id)
+
+
+@callback
+def async_generate_video_url(
+    entry_id: str, camera_id: str, start: datetime, end: datetime
+) -> str:
+    """Generate the URL of a recording of a camera."""
+    return VideoProxyView.url.format(
+        entry_id=entry_id,
+        camera_id=camera_id,
+        start=int(start.timestamp() * 1000),
+        end=int(end.timestamp() * 1000),
+    )
+
+
+class ProtectProxyView(HomeAssistantView):
+    """Base class to proxy requests to UniFi Protect."""
+
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    def _get_data(self, entry_id: str) -> ProtectData | None:
+        data = self.hass.data.get(DOMAIN, {}).get(entry_id)
+        if isinstance(data, ProtectData):
+            return data
+        return None
+
+
+class ImageProxyView(ProtectProxyView, ABC):
+    """Base class to proxy event images through the on-disk cache."""
+
+    content_type = "image/jpeg"
+
+    def __init__(self, hass: HomeAssistant, cache: ProtectFileCache) -> None:
+        """Initialize the view."""
+        super().__init__(hass)
+        self._cache = cache
+
+    @abstractmethod
+    async def _async_fetch(self, data: ProtectData, event_id: str) -> bytes | None:
+        """Get the image of an event from the NVR."""
+
+    async def get(
+        self, request: web.Request, entry_id: str, event_id: str
+    ) -> web.Response:
+        """Get an event image."""
+        if (data := self._get_data(entry_id)) is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        async def _async_fetch() -> bytes | None:
+            try:
+                return await self._async_fetch(data, event_id)
+            except NvrError as err:
+                _LOGGER.debug("Could not get %s for %s: %s", self.name, event_id, err)
+                return None
+
+        event = data.api.bootstrap.events.get(event_id)
+        if event is not None and event.end is None:
+            # images of an ongoing event still change
+            image = await _async_fetch()
+            cache_control = CACHE_NO_STORE
+        else:
+            # images of a finished event never change, so the NVR is only asked once
+            key = f"{self.name}_{event_id}"
+            image = await self._cache.async_get_or_fetch(key, _async_fetch)
+            cache_control = CACHE_IMMUTABLE
+
+        if image is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        return web.Response(
+            body=image,
+            content_type=self.content_type,
+            headers={"Cache-Control": cache_control},
+        )
+
+
+class ThumbnailProxyView(ImageProxyView):
+    """View to proxy event thumbnails from UniFi Protect."""
+
+    url = "/api/unifiprotect/thumbnail/{entry_id}/{event_id}"
+    name = "api:unifiprotect_thumbnail"
+
+    async def _async_fetch(self, data: ProtectData, event_id: str) -> bytes | None:
+        return await data.api.get_event_thumbnail(f"e-{event_id}")
+
+
+class HeatmapProxyView(ImageProxyView):
+    """View to proxy event motion heatmaps from UniFi Protect."""
+
+    url = "/api/unifiprotect/heatmap/{entry_id}/{event_id}"
+    name = "api:unifiprotect_heatmap"
+    content_type = "image/png"
+
+    async def _async_fetch(self, data: ProtectData, event_id: str) -> bytes | None:
+        return await data.api.get_event_heatmap(f"e-{event_id}")
+
+
+class VideoProxyView(ProtectProxyView):
+    """View to stream recordings from UniFi Protect without buffering them."""
+
+    url = "/api/unifiprotect/video/{entry_id}/{camera_id}/{start}/{end}"
+    name = "api:unifiprotect_video"
+
+    async def get(
+        self, request: web.Request, entry_id: str, camera_id: str, start: str, end: str
+    ) -> web.StreamResponse:
+        """Stream a recording."""
+        if (data := self._get_data(entry_id)) is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        if camera_id not in data.api.bootstrap.cameras:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        params = {"camera": camera_id, "channel": 0, "start": start, "end": end}
+        try:
+            upstream = await data.api.request(
+                "get",
+                f"{data.api.api_path}video/export",
+                require_auth=True,
+                auto_close=False,
+                params=params,
+            )
+        except NvrError as err:
+            _LOGGER.debug("Could not export video for %s: %s", camera_id, err)
+            return web.Response(status=HTTPStatus.BAD_GATEWAY)
+
+        try:
+            if upstream.status != HTTPStatus.OK:
+                return web.Response(status=HTTPStatus.BAD_GATEWAY)
+
+            content_type = upstream.headers.get("Content-Type", "video/mp4")
+            response = web.StreamResponse(headers={"Content-Type": content_type})
+            if upstream.content_length is not None:
+                response.content_length = upstream.content_length
+            await response.prepare(request)
+            async for chunk in upstream.content.iter_chunked(VIDEO_CHUNK_SIZE):
+                await response.write(chunk)
+            await response.write_eof()
+            return response
+        finally:
+            upstream.release()
@@ -0,0 +1,136 @@
+"""Benchmark building the entities of a NVR with many devices.
+
+The devices of a bootstrap dump, as written by ``unifi-protect
+generate-sample-data``, are copied until there are as many as requested. The
+entities of all platforms are then built in one pass, as the integration does
+on setup, and for comparison one platform at a time, as a platform set up
+later does.
+
+Run from the repository root with Home Assistant and pyunifiprotect installed:
+
+    PYTHONPATH=. python scripts/benchmark_entities.py sample_bootstrap.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from copy import deepcopy
+import json
+from pathlib import Path
+import statistics
+import tempfile
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from pyunifiprotect.data import Bootstrap
+
+from custom_components.unifiprotect import ENTITY_FACTORIES, SCAN_INTERVAL
+from custom_components.unifiprotect.const import DOMAIN
+from custom_components.unifiprotect.data import ProtectData
+from custom_components.unifiprotect.session import ProtectSession
+
+DEVICE_KEYS = ("cameras", "lights", "sensors", "viewers")
+
+
+def _build_bootstrap(path: Path, count: int) -> dict[str, Any]:
+    """Copy the devices of a bootstrap dump until there are count devices."""
+    data = json.loads(path.read_text())
+    templates = [(key, device) for key in DEVICE_KEYS for device in data.get(key, [])]
+    if not templates:
+        raise SystemExit(f"No devices in {path}")
+
+    for key in DEVICE_KEYS:
+        data[key] = []
+    for index in range(count):
+        key, template = templates[index % len(templates)]
+        device = deepcopy(template)
+        device["id"] = f"{index:024x}"
+        device["mac"] = f"{index:012X}"
+        device["name"] = f"{template['name']} {index}"
+        data[key].append(device)
+    return data
+
+
+def _measure(rounds: int, func: Callable[[], int]) -> tuple[int, list[float]]:
+    timings: list[float] = []
+    entities = 0
+    for _ in range(rounds):
+        started = time.perf_counter()
+        entities = func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return entities, timings
+
+
+async def _async_run(args: argparse.Namespace) -> None:
+    hass = HomeAssistant()
+    config_dir = tempfile.TemporaryDirectory()
+    hass.config.config_dir = config_dir.name
+    await dr.async_load(hass)
+    await er.async_load(hass)
+
+    login = {CONF_HOST: "127.0.0.1", CONF_USERNAME: "user", CONF_PASSWORD: "pass"}
+    entry = ConfigEntry(
+        version=1,
+        domain=DOMAIN,
+        title="Benchmark",
+        data=login,
+        source="user",
+        options={},
+    )
+    session = ProtectSession(("benchmark",), login, {})
+    api = session.api
+    # pylint: disable=protected-access
+    api._bootstrap = Bootstrap.from_unifi_dict(
+        **_build_bootstrap(args.bootstrap, args.devices), api=api
+    )
+    data = ProtectData(hass, api, SCAN_INTERVAL, entry, session)
+    data.last_update_success = True
+    data.platforms = data.async_get_platforms()
+
+    def _one_pass() -> int:
+        # capabilities are resolved from scratch on setup
+        data._capabilities.clear()
+        data.async_build_entities(ENTITY_FACTORIES)
+        entities = 0
+        for platform in data.platforms:
+            factory = ENTITY_FACTORIES[platform]
+            entities += len(data.async_pop_entities(platform, factory))
+        return entities
+
+    def _per_platform() -> int:
+        data._capabilities.clear()
+        return sum(
+            len(data.async_pop_entities(platform, ENTITY_FACTORIES[platform]))
+            for platform in data.platforms
+        )
+
+    try:
+        for name, func in (("one pass", _one_pass), ("per platform", _per_platform)):
+            entities, timings = _measure(args.rounds, func)
+            print(
+                f"{name}: {args.devices} devices, {entities} entities, "
+                f"median {statistics.median(timings):.1f}ms, "
+                f"min {min(timings):.1f}ms over {args.rounds} rounds"
+            )
+    finally:
+        await session.session.close()
+        await hass.async_stop(force=True)
+        config_dir.cleanup()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("bootstrap", type=Path, help="bootstrap JSON dump")
+    parser.add_argument("--devices", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    asyncio.run(_async_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Tests for the UniFi Protect integration."""
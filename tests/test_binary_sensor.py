@@ -0,0 +1,148 @@
+"""Test the UniFi Protect binary sensor debouncing."""
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+from pyunifiprotect.data import StateType
+
+from custom_components.unifiprotect.binary_sensor import (
+    LIGHT_SENSORS,
+    MOTION_SENSORS,
+    SENSE_SENSORS,
+    ProtectDeviceBinarySensor,
+    ProtectEventBinarySensor,
+)
+from custom_components.unifiprotect.utils import TimerWheel
+
+
+class FakeLoop:
+    """Event loop clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        """Init the clock."""
+        self.now = 1000.0
+
+    def time(self) -> float:
+        """Return the loop time."""
+        return self.now
+
+    def call_at(self, when: float, callback: Any) -> Mock:
+        """Pretend to arm a timer, the test fires the wheel itself."""
+        return Mock()
+
+
+@pytest.fixture(name="clock")
+def clock_fixture():
+    """Fake loop whose time also drives time.monotonic."""
+    loop = FakeLoop()
+    with patch(
+        "custom_components.unifiprotect.binary_sensor.time.monotonic",
+        side_effect=loop.time,
+    ):
+        yield loop
+
+
+def _get_description(descriptions: Any, key: str) -> Any:
+    return next(desc for desc in descriptions if desc.key == key)
+
+
+def _build_sensor(clock: FakeLoop, klass: type, description: Any, value: str):
+    data = Mock()
+    data.last_update_success = False
+    data.timers = TimerWheel(clock)  # type: ignore[arg-type]
+
+    device = Mock()
+    device.id = "test_device"
+    device.name = "Test Device"
+    device.state = StateType.CONNECTED
+    device.last_motion_event = None
+    setattr(device, value, False)
+
+    return klass(data, device, description), data.timers
+
+
+def _set_value(sensor: ProtectDeviceBinarySensor, value: str, is_on: bool) -> None:
+    setattr(sensor.device, value, is_on)
+    sensor._async_update_device_from_protect()
+
+
+def _advance(clock: FakeLoop, timers: TimerWheel, seconds: float) -> None:
+    clock.now += seconds
+    timers._fire()
+
+
+@pytest.mark.parametrize(
+    "descriptions,value",
+    [
+        (LIGHT_SENSORS, "is_pir_motion_detected"),
+        (SENSE_SENSORS, "is_motion_detected"),
+    ],
+)
+def test_pir_motion_flap_suppressed(clock: FakeLoop, descriptions, value):
+    """A PIR toggling inside the off delay stays on."""
+    description = _get_description(descriptions, "motion")
+    sensor, timers = _build_sensor(clock, ProtectDeviceBinarySensor, description, value)
+    assert sensor.is_on is False
+
+    _set_value(sensor, value, True)
+    assert sensor.is_on is True
+
+    for _ in range(5):
+        _advance(clock, timers, 0.3)
+        _set_value(sensor, value, False)
+        assert sensor.is_on is True
+        _advance(clock, timers, 0.3)
+        _set_value(sensor, value, True)
+        assert sensor.is_on is True
+
+    _set_value(sensor, value, False)
+    _advance(clock, timers, 1)
+    assert sensor.is_on is True
+    _advance(clock, timers, 1.5)
+    assert sensor.is_on is False
+
+
+def test_camera_motion_held_on(clock: FakeLoop):
+    """A short camera motion event is held on for the on hold."""
+    description = _get_description(MOTION_SENSORS, "motion")
+    sensor, timers = _build_sensor(
+        clock, ProtectEventBinarySensor, description, "is_motion_detected"
+    )
+    event = Mock()
+    event.score = 80
+    sensor.device.last_motion_event = event
+
+    _set_value(sensor, "is_motion_detected", True)
+    assert sensor.is_on is True
+    assert sensor.extra_state_attributes["event_score"] == 80
+
+    _advance(clock, timers, 0.5)
+    _set_value(sensor, "is_motion_detected", False)
+    assert sensor.is_on is True
+    # the event stays attached while held on
+    assert sensor.extra_state_attributes["event_score"] == 80
+
+    _advance(clock, timers, 3)
+    _set_value(sensor, "is_motion_detected", True)
+    _set_value(sensor, "is_motion_detected", False)
+    assert sensor.is_on is True
+
+    _advance(clock, timers, 2)
+    assert sensor.is_on is False
+    assert sensor.extra_state_attributes["event_score"] == 0
+
+
+def test_no_debounce_without_delays(clock: FakeLoop):
+    """Sensors without delays follow the device."""
+    description = _get_description(SENSE_SENSORS, "tampering")
+    sensor, timers = _build_sensor(
+        clock, ProtectDeviceBinarySensor, description, "is_tampering_detected"
+    )
+
+    _set_value(sensor, "is_tampering_detected", True)
+    assert sensor.is_on is True
+    _set_value(sensor, "is_tampering_detected", False)
+    assert sensor.is_on is False
+    assert not timers.is_scheduled(sensor)
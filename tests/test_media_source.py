@@ -0,0 +1,141 @@
+"""Test the UniFi Protect media source."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+from homeassistant.components.media_source.error import Unresolvable
+from homeassistant.util import dt as dt_util
+import pytest
+
+from custom_components.unifiprotect.const import DOMAIN
+from custom_components.unifiprotect.data import ProtectData
+from custom_components.unifiprotect.media_source import (
+    MAX_DAYS,
+    PAGE_SIZE,
+    ProtectMediaSource,
+)
+
+ENTRY_ID = "test_entry"
+CAMERA_ID = "test_camera"
+
+
+@pytest.fixture(name="data")
+def data_fixture():
+    """Mock ProtectData for a NVR with a single camera."""
+    data = Mock(spec=ProtectData)
+    data.entry_id = ENTRY_ID
+    data.api = Mock()
+    data.api.bootstrap.nvr.name = "Test NVR"
+
+    camera = Mock()
+    camera.id = CAMERA_ID
+    camera.name = "Test Camera"
+    camera.stats.video.recording_start = None
+    data.api.bootstrap.cameras = {CAMERA_ID: camera}
+    data.api.api_request_list = AsyncMock(return_value=[])
+    return data
+
+
+@pytest.fixture(name="source")
+def source_fixture(data: Mock):
+    """Media source with the mock NVR loaded."""
+    hass = Mock()
+    hass.data = {DOMAIN: {ENTRY_ID: data}}
+    return ProtectMediaSource(hass)
+
+
+def _browse(source: ProtectMediaSource, identifier: str | None):
+    item = Mock()
+    item.identifier = identifier
+    return asyncio.run(source.async_browse_media(item))
+
+
+def _event(event_id: str, start: int, end: int | None) -> dict:
+    return {
+        "id": event_id,
+        "type": "smartDetectZone",
+        "start": start,
+        "end": end,
+        "smartDetectTypes": ["person"],
+    }
+
+
+def test_browse_root(source: ProtectMediaSource):
+    """The root lists each NVR."""
+    root = _browse(source, None)
+
+    assert [child.identifier for child in root.children] == [ENTRY_ID]
+    assert root.children[0].title == "Test NVR"
+
+
+def test_browse_nvr(source: ProtectMediaSource):
+    """A NVR lists its cameras."""
+    nvr = _browse(source, ENTRY_ID)
+
+    assert nvr.identifier == ENTRY_ID
+    assert [child.identifier for child in nvr.children] == [f"{ENTRY_ID}:{CAMERA_ID}"]
+
+
+def test_browse_camera(source: ProtectMediaSource):
+    """A camera lists the last days, newest first."""
+    camera = _browse(source, f"{ENTRY_ID}:{CAMERA_ID}")
+
+    today = dt_util.start_of_local_day().strftime("%Y-%m-%d")
+    assert len(camera.children) == MAX_DAYS
+    assert camera.children[0].identifier == f"{ENTRY_ID}:{CAMERA_ID}:{today}"
+
+
+def test_browse_day(source: ProtectMediaSource, data: Mock):
+    """A day lists finished events and pages to older ones."""
+    start = dt_util.start_of_local_day() + timedelta(hours=12)
+    start_ms = int(start.timestamp() * 1000)
+    events = [_event("ongoing", start_ms + 100, None)]
+    events += [
+        _event(f"event_{index:02}", start_ms - index, start_ms - index + 10)
+        for index in range(PAGE_SIZE - 3)
+    ]
+    # two events starting in the same millisecond at the end of the page
+    tied = start_ms - PAGE_SIZE
+    ties = [_event("tie_a", tied, tied + 10), _event("tie_b", tied, tied + 10)]
+    data.api.api_request_list.return_value = events + ties
+
+    day = start.strftime("%Y-%m-%d")
+    base = f"{ENTRY_ID}:{CAMERA_ID}:{day}"
+    page = _browse(source, base)
+
+    *children, older = page.children
+    assert len(children) == PAGE_SIZE - 3
+    assert children[0].identifier == (
+        f"{ENTRY_ID}:{CAMERA_ID}:event:event_00:{start_ms}:{start_ms + 10}"
+    )
+    assert children[0].title.endswith("(person)")
+    assert children[0].thumbnail is not None
+    last = start_ms - PAGE_SIZE + 4
+    assert older.identifier == f"{base}:{last}:event_{PAGE_SIZE - 4}"
+
+    # the NVR returns the last listed event again and both ties
+    data.api.api_request_list.return_value = [events[-1], *ties]
+    page = _browse(source, older.identifier)
+    assert page.identifier == older.identifier
+    assert [child.identifier.split(":")[3] for child in page.children] == [
+        "tie_b",
+        "tie_a",
+    ]
+    params = dict(data.api.api_request_list.call_args.kwargs["params"])
+    assert params["end"] == last + 1
+
+
+def test_browse_event_not_expandable(source: ProtectMediaSource):
+    """Events are leaves of the tree."""
+    with pytest.raises(Unresolvable):
+        _browse(source, f"{ENTRY_ID}:{CAMERA_ID}:event:event_0:1:2")
+
+
+def test_browse_unknown(source: ProtectMediaSource):
+    """Unknown NVRs and cameras cannot be browsed."""
+    with pytest.raises(Unresolvable):
+        _browse(source, "other_entry")
+    with pytest.raises(Unresolvable):
+        _browse(source, f"{ENTRY_ID}:other_camera")